@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chasse au Trésor - Temps de nouvelle partie selon la taille du plateau
+- "à froid" : pool de boutons vide, toute la grille est créée
+- "pool"    : même taille qu'avant, quelques cases révélées à remettre à zéro
+- "agrandir" / "réduire" : passage depuis la taille précédente de la liste
+Chaque mesure inclut update_idletasks (géométrie et affichage Tk).
+"à froid" correspond au coût d'avant le pool (grille entièrement recréée).
+Il faut un affichage Tk ; sans lui le benchmark est ignoré (code de sortie 0).
+
+  python bench_grille_chasse.py [--tailles 6,10,20,30,40] [--repetitions 5]
+  xvfb-run python bench_grille_chasse.py      # machine sans écran
+"""
+
+import argparse
+import random
+import sys
+import time
+import tkinter as tk
+
+from chasse_tresor import InterfaceChasse, ModeleJeu
+
+
+def modele(taille):
+    # plateau fixe par taille : mesures reproductibles
+    n = max(1, taille * taille // 12)
+    return ModeleJeu(taille=taille, nb_tresors=n, nb_pieges=n, max_tentatives=taille * taille,
+                     rng=random.Random(taille))
+
+
+def chronometrer(ui, taille):
+    t0 = time.perf_counter()
+    ui._lancer_partie(modele(taille))
+    ui.root.update_idletasks()
+    return (time.perf_counter() - t0) * 1000
+
+
+def vider_pool(ui):
+    # laisser passer les rappels after() en attente avant de détruire les boutons
+    ui.root.update()
+    for b in ui._pool.values():
+        b.destroy()
+    ui._pool.clear()
+    ui._appliquees.clear()
+    ui._taille_affichee = 0
+
+
+def reveler(ui, nombre):
+    """
+    Révèle `nombre` cases sans trésor par le modèle puis redessine la grille :
+    ni victoire (boîtes de dialogue modales) ni animations after() en attente.
+    """
+    modele = ui.modele
+    tresors = modele.tresors
+    cases = [c for c in ui._cases if c not in tresors][:nombre]
+    for x, y in cases:
+        ui._cases[x, y] = (modele.jouer_case(x, y), False)
+    ui._dessiner_grille()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Latence de nouvelle partie de l'interface Tk")
+    ap.add_argument("--tailles", default="6,10,20,30,40")
+    ap.add_argument("--repetitions", type=int, default=5)
+    args = ap.parse_args(argv)
+    tailles = [int(t) for t in args.tailles.split(",")]
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"pas d'affichage Tk ({e}) : benchmark ignoré", file=sys.stderr)
+        return
+    ui = InterfaceChasse(root)
+    root.update()
+
+    print(" taille | à froid (ms) | pool (ms) | agrandir (ms) | réduire (ms)")
+    precedente = tailles[0]
+    for taille in tailles:
+        froid, pool, agrandir, reduire = [], [], [], []
+        for _ in range(args.repetitions):
+            vider_pool(ui)
+            froid.append(chronometrer(ui, taille))
+            reveler(ui, 3)
+            pool.append(chronometrer(ui, taille))
+            chronometrer(ui, precedente)
+            agrandir.append(chronometrer(ui, taille))
+            reduire.append(chronometrer(ui, precedente))
+            chronometrer(ui, taille)
+        print(f" {taille:6d} | {min(froid):12.1f} | {min(pool):9.1f} | "
+              f"{min(agrandir):13.1f} | {min(reduire):12.1f}", flush=True)
+        precedente = taille
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
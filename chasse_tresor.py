@@ -7,128 +7,147 @@ Chasse au Trésor - Version Française
 - Affiche les nombres en chiffres ET en lettres françaises (ex : 10 (dix))
 - Modes : Classique, Chrono, Difficile
 - Skins (thèmes)
-- Sauvegarde des meilleurs scores dans scores.json
-- Sons optionnels via pygame (silencieux si non installé)
+- Sauvegarde de tous les scores dans scores.db (sqlite3, voir stockage_scores.py)
+- Sons optionnels synthétisés via pygame, chargés en arrière-plan (voir sons.py)
 """
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 import random
-import json
-import os
+import math
 import time
 
-# Tentative d'utiliser pygame pour sons (facultatif)
-try:
-    import pygame
-    pygame.mixer.init()
-    SON_DISPONIBLE = True
-except Exception:
-    SON_DISPONIBLE = False
+from nombres_fr import affichage_nombre
+from classement import Classement, SourceSQLite
+from sons import SONS
+from stockage_scores import StockageScores
 
-FICHIER_SCORES = "scores.json"
+FICHIER_SCORES = "scores.db"
+
+# paramètres de ModeleJeu pour chaque mode (la durée du Chrono est demandée au joueur)
+MODES = {
+    "Classique": dict(taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=15),
+    "Chrono": dict(taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=9999, chrono=60),
+    "Difficile": dict(taille=7, nb_tresors=4, nb_pieges=6, max_tentatives=12),
+}
 
 
 # -------------------------
-# Convertisseur de nombres en français (0..9999)
+# Logique du jeu
 # -------------------------
-def nombre_en_lettres(n: int) -> str:
+class PlateauEnsembles:
+    """Plateau d'origine : ensembles de coordonnées (x, y)."""
+    __slots__ = ("tresors", "pieges", "revelees")
+
+    def __init__(self, taille, tresors, pieges):
+        self.tresors = set(tresors)
+        self.pieges = set(pieges)
+        self.revelees = set()
+
+    @property
+    def tresors_restants(self):
+        return len(self.tresors)
+
+    def reveler(self, x, y):
+        """'deja', 'tresor', 'piege' ou 'vide' ; la case est marquée révélée."""
+        if (x, y) in self.revelees:
+            return "deja"
+        self.revelees.add((x, y))
+        if (x, y) in self.tresors:
+            self.tresors.remove((x, y))
+            return "tresor"
+        if (x, y) in self.pieges:
+            self.pieges.remove((x, y))
+            return "piege"
+        return "vide"
+
+
+class PlateauCompact:
     """
-    Convertit un entier 0..9999 en représentation littérale française simple.
-    Gère les règles standards pour 0..9999 (approximation correcte pour nos usages).
+    Un octet par case dans un bytearray indexé par y*taille + x :
+    VIDE / TRESOR / PIEGE, plus le bit REVELEE, pour héberger beaucoup de parties
+    à la fois. Partie 6x6 complète (ModeleJeu compris, rng partagé) : ~300 octets,
+    contre ~1,2 Ko avec les ensembles au départ et ~2,4 Ko en fin de partie
+    (les cases révélées s'accumulent), soit 4 à 8x moins.
     """
-    if n < 0:
-        return "moins " + nombre_en_lettres(-n)
-    if n == 0:
-        return "zéro"
-
-    unités = [
-        "", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf"
-    ]
-    spéciaux = {
-        10: "dix", 11: "onze", 12: "douze", 13: "treize", 14: "quatorze",
-        15: "quinze", 16: "seize"
-    }
-    dizaines = [
-        "", "", "vingt", "trente", "quarante", "cinquante", "soixante"
-    ]
-
-    def deux_chiffres(x):
-        if x < 10:
-            return unités[x]
-        if 10 <= x <= 16:
-            return spéciaux[x]
-        if 17 <= x <= 19:
-            return "dix-" + unités[x - 10]
-        if 20 <= x <= 69:
-            d = x // 10
-            u = x % 10
-            base = dizaines[d]
-            if u == 1:
-                return base + "-et-un"
-            elif u > 0:
-                return base + "-" + unités[u]
-            else:
-                return base
-        if 70 <= x <= 79:
-            # 70 = soixante-dix, 71 = soixante-et-onze, ...
-            rest = x - 60
-            return "soixante-" + deux_chiffres(rest)
-        if 80 <= x <= 99:
-            # 80 = quatre-vingts (sans 's' si suite), 81 = quatre-vingt-un
-            rest = x - 80
-            if rest == 0:
-                return "quatre-vingts"
-            else:
-                return "quatre-vingt-" + deux_chiffres(rest)
-        return ""
-
-    def trois_chiffres(x):
-        if x < 100:
-            return deux_chiffres(x)
-        h = x // 100
-        rest = x % 100
-        if h == 1:
-            prefix = "cent"
-        else:
-            prefix = unités[h] + " cent"
-        if rest == 0:
-            # cent(s) prend un 's' quand il est multiple exact et >1
-            if h > 1:
-                return prefix + "s"
-            return prefix
-        return prefix + " " + deux_chiffres(rest)
+    __slots__ = ("taille", "cases", "tresors_restants")
 
-    if n < 1000:
-        return trois_chiffres(n)
+    VIDE, TRESOR, PIEGE, REVELEE = 0, 1, 2, 4
 
-    milliers = n // 1000
-    reste = n % 1000
-    if milliers == 1:
-        prefix = "mille"
-    else:
-        prefix = nombre_en_lettres(milliers) + " mille"
-    if reste == 0:
-        return prefix
-    return prefix + " " + trois_chiffres(reste)
+    def __init__(self, taille, tresors, pieges):
+        self.taille = taille
+        self.cases = cases = bytearray(taille * taille)
+        for x, y in tresors:
+            cases[y * taille + x] = self.TRESOR
+        for x, y in pieges:
+            cases[y * taille + x] = self.PIEGE
+        self.tresors_restants = len(tresors)
+
+    def _positions(self, masque, valeur):
+        t = self.taille
+        return {(i % t, i // t) for i, c in enumerate(self.cases) if c & masque == valeur}
+
+    # vues en ensembles (coûteuses, pour le débogage)
+    @property
+    def tresors(self):
+        return self._positions(self.TRESOR | self.REVELEE, self.TRESOR)
+
+    @property
+    def pieges(self):
+        return self._positions(self.PIEGE | self.REVELEE, self.PIEGE)
+
+    @property
+    def revelees(self):
+        return self._positions(self.REVELEE, self.REVELEE)
+
+    def reveler(self, x, y):
+        i = y * self.taille + x
+        c = self.cases[i]
+        if c & self.REVELEE:
+            return "deja"
+        self.cases[i] = c | self.REVELEE
+        if c == self.TRESOR:
+            self.tresors_restants -= 1
+            return "tresor"
+        if c == self.PIEGE:
+            return "piege"
+        return "vide"
 
 
-def affichage_nombre(n: int) -> str:
-    """Renvoie '12 (douze)'"""
-    return f"{n} ({nombre_en_lettres(n)})"
+PLATEAUX = {"ensembles": PlateauEnsembles, "compact": PlateauCompact}
+
+# générateur des parties sans rng explicite
+RNG_PARTAGE = random.Random()
 
 
-# -------------------------
-# Logique du jeu
-# -------------------------
 class ModeleJeu:
-    def __init__(self, taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=15, mode="Classique", chrono=60):
+    __slots__ = ("rng", "taille", "nb_tresors", "nb_pieges", "max_tentatives", "mode", "chrono",
+                 "type_plateau", "horloge", "plateau", "score", "tentatives", "start_time", "finished")
+
+    def __init__(self, taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=15, mode="Classique", chrono=60,
+                 rng=None, plateau="ensembles", horloge=time.monotonic):
+        if taille < 1:
+            raise ValueError(f"taille de plateau invalide : {taille}")
+        if nb_tresors < 1 or nb_pieges < 0:
+            raise ValueError(f"nombre de trésors / pièges invalide : {nb_tresors} / {nb_pieges}")
+        if nb_tresors + nb_pieges > taille * taille:
+            raise ValueError(
+                f"{nb_tresors} trésors + {nb_pieges} pièges ne tiennent pas sur {taille}x{taille} cases")
+        if plateau not in PLATEAUX:
+            raise ValueError(f"plateau inconnu : {plateau!r}")
+        # générateur injectable (random.Random(seed) pour des parties reproductibles),
+        # partagé par défaut : un Mersenne Twister pèse ~2,5 Ko, plus que le plateau
+        self.rng = rng if rng is not None else RNG_PARTAGE
         self.taille = taille
         self.nb_tresors = nb_tresors
         self.nb_pieges = nb_pieges
         self.max_tentatives = max_tentatives
         self.mode = mode
         self.chrono = chrono
+        # "ensembles" (sets de tuples) ou "compact" (bytearray)
+        self.type_plateau = plateau
+        # horloge monotone injectable (horloge virtuelle pour les simulations du mode Chrono)
+        self.horloge = horloge
 
         self.reset()
 
@@ -137,19 +156,47 @@ class ModeleJeu:
         self.tentatives = 0
         self.start_time = None
         self.finished = False
-        self.tresors = self._generer_positions(self.nb_tresors)
-        self.pieges = self._generer_positions(self.nb_pieges, exclude=self.tresors)
-        self.revelees = set()
+        cases = self._tirer_cases(self.nb_tresors + self.nb_pieges)
+        self.plateau = PLATEAUX[self.type_plateau](self.taille, cases[:self.nb_tresors], cases[self.nb_tresors:])
+
+    def _tirer_cases(self, k):
+        """k cases distinctes tirées sans remise, en O(k) (pas d'échantillonnage par rejet)."""
+        t = self.taille
+        return [divmod(c, t) for c in self.rng.sample(range(t * t), k)]
 
-    def _generer_positions(self, nb, exclude=None):
-        exclude = exclude or set()
-        pos = set()
-        while len(pos) < nb:
-            x = random.randint(0, self.taille - 1)
-            y = random.randint(0, self.taille - 1)
-            if (x, y) not in exclude:
-                pos.add((x, y))
-        return pos
+    # échéance du mode Chrono (partagée par l'interface, le serveur et les bots)
+    def demarrer(self):
+        """Lance le chrono (sinon il démarre au premier clic)."""
+        if self.start_time is None:
+            self.start_time = self.horloge()
+
+    @property
+    def echeance(self):
+        """Instant d'expiration sur self.horloge, ou None (pas Chrono / pas démarré)."""
+        if self.mode != "Chrono" or self.start_time is None:
+            return None
+        return self.start_time + self.chrono
+
+    def restant(self):
+        """Secondes restantes (>= 0), ou None hors mode Chrono."""
+        if self.mode != "Chrono":
+            return None
+        if self.start_time is None:
+            return float(self.chrono)
+        return max(0.0, self.start_time + self.chrono - self.horloge())
+
+    # vues sur le plateau
+    @property
+    def tresors(self):
+        return self.plateau.tresors
+
+    @property
+    def pieges(self):
+        return self.plateau.pieges
+
+    @property
+    def revelees(self):
+        return self.plateau.revelees
 
     def jouer_case(self, x, y):
         """
@@ -164,33 +211,28 @@ class ModeleJeu:
         if self.finished:
             return "perdu"
 
-        if self.start_time is None:
-            self.start_time = time.time()
+        self.demarrer()
 
         # Vérifier chrono si mode Chrono
-        if self.mode == "Chrono":
-            elapsed = time.time() - self.start_time
-            if elapsed >= self.chrono:
-                self.finished = True
-                return "perdu"
+        if self.mode == "Chrono" and self.horloge() >= self.echeance:
+            self.finished = True
+            return "perdu"
 
-        if (x, y) in self.revelees:
+        resultat = self.plateau.reveler(x, y)
+        if resultat == "deja":
             return "deja"
 
         self.tentatives += 1
-        self.revelees.add((x, y))
 
-        if (x, y) in self.tresors:
+        if resultat == "tresor":
             self.score += 10
-            self.tresors.remove((x, y))
-            if not self.tresors:
+            if not self.plateau.tresors_restants:
                 self.finished = True
                 return "victoire"
             return "tresor"
 
-        if (x, y) in self.pieges:
+        if resultat == "piege":
             self.score = max(0, self.score - 5)
-            self.pieges.remove((x, y))
             return "piege"
 
         # vide
@@ -200,26 +242,75 @@ class ModeleJeu:
         return "vide"
 
 
+class MinuteurChrono:
+    """
+    Échéancier du mode Chrono, sans polling : un seul rappel planifié à la fois,
+    à la prochaine seconde affichée qui change (si sur_seconde est fourni), sinon
+    directement à l'expiration.
+
+    planifier(délai_s, rappel) -> jeton et annuler(jeton) adaptent la boucle hôte :
+    root.after / after_cancel pour Tk, loop.call_later / handle.cancel pour asyncio.
+    """
+
+    def __init__(self, modele, planifier, annuler, sur_seconde=None, sur_expiration=None):
+        self.modele = modele
+        self.planifier = planifier
+        self.annuler = annuler
+        self.sur_seconde = sur_seconde
+        self.sur_expiration = sur_expiration
+        self.jeton = None
+
+    @property
+    def actif(self):
+        return self.jeton is not None
+
+    def demarrer(self):
+        self.arreter()
+        self.modele.demarrer()
+        self._armer()
+
+    def arreter(self):
+        if self.jeton is not None:
+            self.annuler(self.jeton)
+            self.jeton = None
+
+    def _armer(self):
+        self.jeton = None
+        modele = self.modele
+        restant = modele.restant()
+        if restant is None or modele.finished:
+            return
+        secondes = math.ceil(restant)     # 60 au départ, 0 exactement à l'expiration
+        if self.sur_seconde is not None:
+            self.sur_seconde(secondes)
+        if secondes <= 0:
+            modele.finished = True
+            if self.sur_expiration is not None:
+                self.sur_expiration()
+            return
+        delai = restant - (secondes - 1) if self.sur_seconde is not None else restant
+        self.jeton = self.planifier(delai, self._armer)
+
+
 # -------------------------
 # Persistance des scores
 # -------------------------
-def charger_scores():
-    if not os.path.exists(FICHIER_SCORES):
-        return []
+# top 50 par mode gardé en mémoire, relu seulement si la base change ;
+# chaque score est écrit dans la base dès la fin de partie (visible des autres processus)
+_classement = Classement(SourceSQLite(StockageScores(FICHIER_SCORES)), k=50)
+
+
+def charger_scores(n=50, mode=None):
+    """Meilleurs scores (tous modes ou un mode), du meilleur au moins bon."""
     try:
-        with open(FICHIER_SCORES, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _classement.meilleurs(n, mode)
     except Exception:
         return []
 
 
 def sauvegarder_score(nom, score, mode):
-    scores = charger_scores()
-    scores.append({"nom": nom, "score": score, "mode": mode, "date": time.time()})
-    scores = sorted(scores, key=lambda s: s["score"], reverse=True)[:50]
     try:
-        with open(FICHIER_SCORES, "w", encoding="utf-8") as f:
-            json.dump(scores, f, indent=2, ensure_ascii=False)
+        _classement.ajouter(nom, score, mode)
     except Exception:
         pass
 
@@ -242,6 +333,7 @@ class InterfaceChasse:
             "tresor": "#39ff14", "piege": "#ff206e", "vide": "#94b0e0"
         }
     }
+    ICONES = {"cachee": "❓", "tresor": "💎", "piege": "💣", "vide": "⬜"}
 
     def __init__(self, root):
         self.root = root
@@ -252,7 +344,18 @@ class InterfaceChasse:
         self.son_active = True
         self.modele = ModeleJeu()
         self.boutons = []
-        self.timer_id = None
+        self.minuteur = None
+        # boutons réutilisés d'une partie à l'autre : (x, y) -> tk.Button
+        self._pool = {}
+        self._taille_affichee = 0
+        # contenu voulu de chaque case (contenu, actif) et options Tk réellement appliquées
+        self._cases = {}
+        self._appliquees = {}
+        self.partie = 0
+        # mixer ouvert sur le thread principal une fois la fenêtre affichée (import de
+        # pygame compris), effets synthétisés dans un thread
+        if self.son_active:
+            self.root.after_idle(SONS.precharger)
 
         self._construire_interface()
         self._appliquer_skin()
@@ -297,29 +400,53 @@ class InterfaceChasse:
         bas.pack(pady=2)
 
     def _creer_grille_boutons(self):
-        for child in self.cadre_grille.winfo_children():
-            child.destroy()
-        self.boutons = []
+        """
+        Ajuste la grille à la taille du modèle en réutilisant les boutons existants :
+        seuls les boutons en plus sont créés, ceux en trop sont masqués (grid_remove).
+        """
         taille = self.modele.taille
-        for i in range(taille):
-            ligne = []
-            for j in range(taille):
-                b = tk.Button(self.cadre_grille, text="❓", font=("Helvetica", 16, "bold"),
-                              width=4, height=2, command=lambda x=i, y=j: self.clic_case(x, y))
-                b.grid(row=i, column=j, padx=6, pady=6)
-                ligne.append(b)
-            self.boutons.append(ligne)
+        ancienne = self._taille_affichee
+        for i in range(max(taille, ancienne)):
+            for j in range(max(taille, ancienne)):
+                dedans = i < taille and j < taille
+                affiche = i < ancienne and j < ancienne
+                if dedans and not affiche:
+                    b = self._pool.get((i, j))
+                    if b is None:
+                        b = self._pool[i, j] = tk.Button(
+                            self.cadre_grille, font=("Helvetica", 16, "bold"), width=4, height=2,
+                            command=lambda x=i, y=j: self.clic_case(x, y))
+                    b.grid(row=i, column=j, padx=6, pady=6)
+                elif affiche and not dedans:
+                    self._pool[i, j].grid_remove()
+        self._taille_affichee = taille
+        self.boutons = [[self._pool[i, j] for j in range(taille)] for i in range(taille)]
+        self.partie += 1
+        self._cases = {(i, j): ("cachee", True) for i in range(taille) for j in range(taille)}
+
+    def _aspect(self, contenu, actif):
+        skin = self.SKINS[self.skin]
+        fond = skin["btn_bg"] if contenu == "cachee" else skin[contenu]
+        return self.ICONES[contenu], fond, skin["texte"], "normal" if actif else "disabled"
+
+    def _dessiner_case(self, x, y):
+        """Reconfigure le bouton seulement si son aspect voulu a changé."""
+        aspect = self._aspect(*self._cases[x, y])
+        if self._appliquees.get((x, y)) != aspect:
+            texte, fond, encre, etat = aspect
+            self._pool[x, y].configure(text=texte, bg=fond, fg=encre, activebackground=fond, state=etat)
+            self._appliquees[x, y] = aspect
+
+    def _dessiner_grille(self):
+        for (x, y) in self._cases:
+            self._dessiner_case(x, y)
 
     def _appliquer_skin(self):
         skin = self.SKINS[self.skin]
         self.root.configure(bg=skin["bg"])
         for w in [self.label_score, self.label_tentatives, self.label_timer, self.légende]:
             w.configure(bg=skin["bg"], fg=skin["texte"])
-        for row in self.boutons:
-            for b in row:
-                b.configure(bg=skin["btn_bg"], fg=skin["texte"], activebackground=skin["btn_bg"])
-        # mise à jour de la fenêtre (remplace self.update erroné)
-        self.root.update()
+        self._dessiner_grille()
 
     def clic_case(self, x, y):
         resultat = self.modele.jouer_case(x, y)
@@ -333,17 +460,17 @@ class InterfaceChasse:
             return
 
         if resultat == "tresor":
-            self._reveler_bouton(btn, "💎", self.SKINS[self.skin]["tresor"])
+            self._reveler_case(x, y, "tresor")
             self._flash(btn)
             self._jouer_son("tresor")
         elif resultat == "piege":
-            self._reveler_bouton(btn, "💣", self.SKINS[self.skin]["piege"])
+            self._reveler_case(x, y, "piege")
             self._secouer(btn)
             self._jouer_son("piege")
         elif resultat == "vide":
-            self._reveler_bouton(btn, "⬜", self.SKINS[self.skin]["vide"])
+            self._reveler_case(x, y, "vide")
         elif resultat == "victoire":
-            self._reveler_bouton(btn, "💎", self.SKINS[self.skin]["tresor"])
+            self._reveler_case(x, y, "tresor")
             self._jouer_son("victoire")
             self._fin_partie(gagne=True)
 
@@ -352,12 +479,17 @@ class InterfaceChasse:
         if self.modele.tentatives >= self.modele.max_tentatives and not self.modele.finished:
             self._fin_partie(perdu=True)
 
-    def _reveler_bouton(self, btn, texte, couleur):
-        btn.configure(text=texte, state="disabled", bg=couleur)
+    def _reveler_case(self, x, y, contenu):
+        self._cases[x, y] = (contenu, False)
+        self._dessiner_case(x, y)
 
     def _flash(self, btn, fois=3, délai=120):
         original = btn.cget("bg")
+        partie = self.partie
         def step(i):
+            if self.partie != partie:
+                # le bouton a été réutilisé par une nouvelle partie
+                return
             if i >= fois:
                 btn.config(bg=original)
                 return
@@ -369,9 +501,13 @@ class InterfaceChasse:
         info = btn.grid_info()
         r, c = info["row"], info["column"]
         orig_padx = info.get("padx", 6)
+        partie = self.partie
         def move(i):
-            if i >= fois:
-                btn.grid(row=r, column=c)
+            if btn.winfo_manager() != "grid":
+                # masqué entre-temps : le prochain grid() remet padx
+                return
+            if i >= fois or self.partie != partie:
+                btn.grid_configure(padx=orig_padx)
                 return
             offset = (-1 if i % 2 == 0 else 1) * dist
             btn.grid(row=r, column=c, padx=orig_padx + offset)
@@ -381,61 +517,56 @@ class InterfaceChasse:
     def _jouer_son(self, nom):
         if not self.son_active:
             return
-        if not SON_DISPONIBLE:
-            return
-        # placeholder: si tu veux ajouter de vrais fichiers .wav, charge-les ici.
-        # pour éviter complexité, on ignore les sons détaillés.
-        try:
-            pass
-        except Exception:
-            pass
+        SONS.jouer(nom)
 
     def nouvelle_partie(self):
         # appliquer paramètres en fonction du mode sélectionné
-        if self.mode == "Classique":
-            self.modele = ModeleJeu(taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=15, mode="Classique")
-        elif self.mode == "Chrono":
+        if self.mode == "Chrono":
             dur = simpledialog.askinteger("Chrono", "Durée du chrono en secondes :", initialvalue=60, minvalue=10, maxvalue=600)
             if dur is None:
                 dur = 60
-            self.modele = ModeleJeu(taille=6, nb_tresors=3, nb_pieges=3, max_tentatives=9999, mode="Chrono", chrono=dur)
-        elif self.mode == "Difficile":
-            self.modele = ModeleJeu(taille=7, nb_tresors=4, nb_pieges=6, max_tentatives=12, mode="Difficile")
+            self.modele = ModeleJeu(mode="Chrono", **dict(MODES["Chrono"], chrono=dur))
+        elif self.mode in MODES:
+            self.modele = ModeleJeu(mode=self.mode, **MODES[self.mode])
         else:
             self.modele = ModeleJeu()
+        self._lancer_partie(self.modele)
 
+    def _lancer_partie(self, modele):
+        self.modele = modele
         self._creer_grille_boutons()
         self._appliquer_skin()
         self._maj_labels()
-        if self.timer_id:
-            try:
-                self.root.after_cancel(self.timer_id)
-            except Exception:
-                pass
-            self.timer_id = None
+        if self.minuteur is not None:
+            self.minuteur.arreter()
+            self.minuteur = None
         if self.modele.mode == "Chrono":
             self._demarrer_chrono()
 
     def _demarrer_chrono(self):
-        if self.modele.start_time is None:
-            self.modele.start_time = time.time()
-        def tic():
-            elapsed = time.time() - (self.modele.start_time or time.time())
-            restant = max(0, int(self.modele.chrono - elapsed))
-            m = restant // 60
-            s = restant % 60
-            self.label_timer.config(text=f"⏱️ {m:02d}:{s:02d}")
-            if restant <= 0:
-                self._fin_partie(perdu=True)
-                return
-            self.timer_id = self.root.after(500, tic)
-        tic()
+        # un rappel par seconde affichée, calé sur l'horloge monotone, rien une fois la partie finie
+        self.minuteur = MinuteurChrono(
+            self.modele,
+            planifier=lambda delai, rappel: self.root.after(max(1, math.ceil(delai * 1000)), rappel),
+            annuler=self.root.after_cancel,
+            sur_seconde=self._afficher_chrono,
+            sur_expiration=lambda: self._fin_partie(perdu=True),
+        )
+        self.minuteur.demarrer()
+
+    def _afficher_chrono(self, restant):
+        m, s = divmod(restant, 60)
+        self.label_timer.config(text=f"⏱️ {m:02d}:{s:02d}")
 
     def _fin_partie(self, gagne=False, perdu=False):
         self.modele.finished = True
-        for row in self.boutons:
-            for b in row:
-                b.config(state="disabled")
+        # arrêter le chrono avant les boîtes de dialogue (elles font tourner la boucle Tk)
+        if self.minuteur is not None:
+            self.minuteur.arreter()
+        for case, (contenu, actif) in self._cases.items():
+            if actif:
+                self._cases[case] = (contenu, False)
+        self._dessiner_grille()
         if gagne:
             nom = simpledialog.askstring("Victoire !", f"Bravo ! Score : {self.modele.score}\nEntrez ton nom pour le tableau :")
             if nom:
@@ -443,12 +574,6 @@ class InterfaceChasse:
             messagebox.showinfo("Victoire", f"Tu as gagné ! Score : {self.modele.score}")
         elif perdu:
             messagebox.showinfo("Fin", f"Partie terminée.\nScore : {self.modele.score}")
-        if self.timer_id:
-            try:
-                self.root.after_cancel(self.timer_id)
-            except Exception:
-                pass
-            self.timer_id = None
         # Afficher aussi positions restantes (optionnel) : on les laisse cachées pour challenge
 
     def ouvrir_parametres(self):
@@ -460,12 +585,12 @@ class InterfaceChasse:
             self.nouvelle_partie()
 
     def afficher_scores(self):
-        scores = charger_scores()
+        scores = charger_scores(15)
         if not scores:
             messagebox.showinfo("Meilleurs scores", "Aucun score enregistré.")
             return
         texte = ""
-        for i, s in enumerate(scores[:15]):
+        for i, s in enumerate(scores):
             nom = s.get("nom", "Anonyme")
             pts = s.get("score", 0)
             mode = s.get("mode", "—")
@@ -479,9 +604,6 @@ class InterfaceChasse:
         )
         if self.modele.mode != "Chrono":
             self.label_timer.config(text="⏱️ --:--")
-        else:
-            if self.timer_id is None:
-                self._demarrer_chrono()
 
 
 # -------------------------
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Classements en mémoire partagés par Cyber Runner et la Chasse au Trésor
+- Scores analysés une seule fois, rechargés seulement si un fichier source
+  change de taille ou de date de modification (mtime_ns)
+- Top K par mode dans des listes triées (bisect), fusion par tas pour le top tous modes
+- Écritures groupées par lots ; les fichiers JSON sont remplacés de façon
+  atomique (fichier temporaire + fsync + os.replace)
+
+  python classement.py bench
+"""
+
+import atexit
+import bisect
+import heapq
+import itertools
+import json
+import os
+import tempfile
+import time
+
+
+def signature(*chemins):
+    """(mtime_ns, taille) de chaque fichier, None s'il n'existe pas."""
+    sig = []
+    for chemin in chemins:
+        try:
+            st = os.stat(chemin)
+        except OSError:
+            sig.append(None)
+        else:
+            sig.append((st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def ecrire_atomique(chemin, donnees):
+    """Remplace `chemin` par `donnees` (bytes) sans jamais laisser un fichier à moitié écrit."""
+    dossier = os.path.dirname(os.path.abspath(chemin))
+    fd, temporaire = tempfile.mkstemp(dir=dossier, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(donnees)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporaire, chemin)
+    except BaseException:
+        try:
+            os.remove(temporaire)
+        except OSError:
+            pass
+        raise
+
+
+# -------------------------
+# Sources
+# -------------------------
+class SourceJSON:
+    """
+    Scores dans un fichier JSON. `lire(objet)` -> liste de dicts (nom, score, mode, date),
+    `ecrire(entrees)` -> objet JSON à enregistrer.
+    """
+
+    def __init__(self, chemin, lire, ecrire):
+        self.chemin = chemin
+        self.lire = lire
+        self.ecrire = ecrire
+
+    @property
+    def fichiers(self):
+        return (self.chemin,)
+
+    def charger(self, k):
+        try:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                return self.lire(json.load(f))
+        except (OSError, ValueError):
+            return []
+
+    def enregistrer(self, entrees):
+        # relire juste avant d'écrire : un autre processus a pu ajouter des scores
+        toutes = self.charger(None) + list(entrees)
+        donnees = json.dumps(self.ecrire(toutes), ensure_ascii=False).encode("utf-8")
+        ecrire_atomique(self.chemin, donnees)
+
+
+class SourceSQLite:
+    """Scores d'un stockage_scores.StockageScores : seuls les top K par mode sont chargés."""
+
+    def __init__(self, stockage):
+        self.stockage = stockage
+
+    @property
+    def fichiers(self):
+        # le journal WAL change à chaque écriture, la base seulement aux checkpoints
+        return (self.stockage.chemin, self.stockage.chemin + "-wal")
+
+    def charger(self, k):
+        cx = self.stockage.connexion
+        modes = [m for (m,) in cx.execute("SELECT DISTINCT mode FROM scores")]
+        return [e for m in modes for e in self.stockage.meilleurs(k, m)]
+
+    def enregistrer(self, entrees):
+        self.stockage.ajouter_lot([(e["nom"], e["score"], e["mode"], e["date"]) for e in entrees])
+
+
+# -------------------------
+# Cache
+# -------------------------
+class Classement:
+    """
+    Top K par mode en mémoire devant une source. Les ajouts sont visibles
+    immédiatement et écrits par lots de `taille_lot` (le reste à la sortie).
+    """
+
+    def __init__(self, source, k=50, taille_lot=1):
+        self.source = source
+        self.k = k
+        self.taille_lot = taille_lot
+        self._modes = {}          # mode -> liste triée de (-score, date, nom, mode)
+        self._attente = []
+        self._signature = None
+        self.rechargements = 0
+        if taille_lot > 1:
+            atexit.register(self.vider)
+
+    def _a_jour(self):
+        sig = signature(*self.source.fichiers)
+        if sig == self._signature and self._signature is not None:
+            return
+        self._modes = {}
+        for e in self.source.charger(self.k):
+            self._inserer(e)
+        for e in self._attente:
+            self._inserer(e)
+        self._signature = sig
+        self.rechargements += 1
+
+    def _inserer(self, e):
+        mode = e.get("mode", "—")
+        lignes = self._modes.setdefault(mode, [])
+        bisect.insort(lignes, (-e.get("score", 0), e.get("date", 0.0), e.get("nom", "Anonyme"), mode))
+        if len(lignes) > self.k:
+            lignes.pop()
+
+    def meilleurs(self, n=15, mode=None):
+        """Top n d'un mode, ou tous modes confondus (fusion par tas des listes triées)."""
+        self._a_jour()
+        if mode is None:
+            lignes = itertools.islice(heapq.merge(*self._modes.values()), n)
+        else:
+            lignes = self._modes.get(mode, ())[:n]
+        return [{"nom": nom, "score": -s, "mode": m, "date": date} for s, date, nom, m in lignes]
+
+    def meilleur(self, mode=None, defaut=0):
+        top = self.meilleurs(1, mode)
+        return top[0]["score"] if top else defaut
+
+    def ajouter(self, nom, score, mode, date=None):
+        self._a_jour()
+        e = {"nom": nom, "score": score, "mode": mode, "date": time.time() if date is None else date}
+        self._attente.append(e)
+        self._inserer(e)
+        if len(self._attente) >= self.taille_lot:
+            self.vider()
+
+    def vider(self):
+        """Écrit les ajouts en attente en une seule opération."""
+        if not self._attente:
+            return
+        attente, self._attente = self._attente, []
+        try:
+            self.source.enregistrer(attente)
+        except Exception:
+            self._attente = attente + self._attente
+            raise
+        # relu au prochain accès (inclut d'éventuels scores d'autres processus)
+        self._signature = None
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def bench(lectures=10_000, taille=100_000):
+    from stockage_scores import StockageScores
+    modes = ("Classique", "Chrono", "Difficile")
+    scores = [{"nom": f"j{i}", "score": i % 60, "mode": modes[i % 3], "date": float(i)} for i in range(taille)]
+
+    def mesurer(lire, fois=lectures):
+        t0 = time.perf_counter()
+        for _ in range(fois):
+            lire()
+        return (time.perf_counter() - t0) / fois * 1e6
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "scores.json")
+        ecrire_atomique(chemin, json.dumps(scores).encode("utf-8"))
+
+        def relire():
+            with open(chemin, "r", encoding="utf-8") as f:
+                return sorted(json.load(f), key=lambda s: s["score"], reverse=True)[:15]
+
+        classement = Classement(SourceJSON(chemin, lire=lambda d: d, ecrire=lambda e: e))
+        print(f"JSON, {taille} scores : relecture {mesurer(relire, 10):.0f} µs, "
+              f"cache {mesurer(lambda: classement.meilleurs(15)):.1f} µs "
+              f"({classement.rechargements} rechargement)")
+
+        stockage = StockageScores(os.path.join(dossier, "scores.db"), importer=None)
+        stockage.ajouter_lot([(e["nom"], e["score"], e["mode"], e["date"]) for e in scores])
+        classement = Classement(SourceSQLite(stockage))
+        print(f"sqlite, {taille} scores : requête {mesurer(lambda: stockage.meilleurs(15)):.0f} µs, "
+              f"cache {mesurer(lambda: classement.meilleurs(15)):.1f} µs "
+              f"({classement.rechargements} rechargement)")
+        stockage.fermer()
+
+
+if __name__ == "__main__":
+    bench()
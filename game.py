@@ -9,258 +9,679 @@
 # - Aucun asset externe
 
 import pygame
+import numpy as np
 import random
-import json
 import os
-from math import sin, cos
+import gc
+from collections import OrderedDict
 
 # ----------------------------- CONSTANTS ----------------------------
-WIDTH, HEIGHT = 900, 540
-FPS = 60
-GROUND_Y = HEIGHT - 90
-GRAVITY = 1.05
+# La physique et le tuning vivent dans runner_sim (simulation sans écran)
+from runner_sim import (
+    WIDTH, HEIGHT, GROUND_Y,
+    INPUT_NONE, INPUT_JUMP, INPUT_SLIDE, EVENT_CRASH, EVENT_JUMP,
+    DEFAULT_TUNING, ObstaclePool, RunnerSim,
+)
+from runner_replay import Recorder, replay_patterns
+from runner_patterns import PATTERNS_FILE, load_patterns
+from runner_profiler import FrameProfiler
+from classement import Classement, SourceJSON
+from sons import SONS
+
+FPS = 60            # cadence d'affichage (plafond de clock.tick)
+TICK_RATE = 60      # cadence fixe de la simulation (le tuning est exprimé par tick à 60 Hz)
+MAX_CATCHUP = 5     # ticks de rattrapage maximum par frame affichée
 FONT_NAME = None
 HIGHSCORE_FILE = "cyber_runner_prime_score.json"
-
-# Player tuning
-JUMP_FORCE = -17
-DOUBLE_JUMP_FORCE = -14
-dash_speed = 14
-SLIDE_TIME = 25
-
-# Level tuning
-SPAWN_RATE = 95
-POWERUP_RATE = 0.1
-SPEED_GROWTH = 0.004
+REPLAY_FILE = "cyber_runner_last.replay"
+PROFILE_FILE = "cyber_runner_profile"   # + .csv / .json
+
+# Background
+BG_COLOR = (10,10,25)
+STRIPE_COLOR = (18,18,40)
+GROUND_COLOR = (20,20,35)
+STRIPE_PERIOD = 220
+STRIPE_WIDTH = 160
+PARALLAX = 0.6
+
+# Particles
+MAX_PARTICLES = 4096
+PARTICLE_GRAVITY = 0.25
+SPRITE_CACHE_SIZE = 512
+ALPHA_STEP = 16
+
+# Text
+TEXT_CACHE_SIZE = 128
+
+# GC pendant PLAY (collecte complète à l'entrée et à la sortie : GAMEOVER, PAUSE) :
+# - "freeze"  : objets existants déplacés dans la génération permanente (gc.freeze) ;
+#               les collectes continuent mais ne parcourent que les objets créés en jeu
+# - "disable" : aucune collecte pendant PLAY (gc.disable), les cycles attendent la sortie
+# - "off"     : comportement par défaut de CPython
+GC_MODE = os.environ.get("CYBER_RUNNER_GC", "freeze")
 
 # ---------------------------- UTILITIES -----------------------------
+def gc_enter_play(mode):
+    if mode == "off":
+        return
+    gc.collect()
+    if mode == "freeze":
+        gc.freeze()
+    elif mode == "disable":
+        gc.disable()
+
+def gc_leave_play(mode):
+    if mode == "off":
+        return
+    if mode == "freeze":
+        gc.unfreeze()
+    elif mode == "disable":
+        gc.enable()
+    gc.collect()
+
+# Meilleur score : même cache que les classements de la Chasse au Trésor,
+# fichier relu seulement s'il change, réécrit de façon atomique à chaque record
+def parse_high(data):
+    """Contenu JSON du fichier de meilleur score -> entrées de classement (ValueError si illisible)."""
+    high = data.get("high", 0) if isinstance(data, dict) else None
+    if isinstance(high, bool) or not isinstance(high, (int, float)):
+        raise ValueError(f"{HIGHSCORE_FILE} : {{\"high\": <score>}} attendu")
+    return [{"nom": "", "score": high, "mode": "runner", "date": 0.0}]
+
+HIGH_SCORES = Classement(SourceJSON(
+    HIGHSCORE_FILE,
+    lire=parse_high,
+    ecrire=lambda entries: {"high": max(e["score"] for e in entries)},
+), k=1)
+
 def load_high():
-    if os.path.exists(HIGHSCORE_FILE):
-        try:
-            return json.load(open(HIGHSCORE_FILE)).get("high", 0)
-        except:
-            return 0
-    return 0
+    try:
+        return HIGH_SCORES.meilleur()
+    except Exception:
+        return 0
 
 def save_high(value):
     try:
-        json.dump({"high": value}, open(HIGHSCORE_FILE, "w"))
-    except:
+        HIGH_SCORES.ajouter("", value, "runner")
+    except Exception:
         pass
 
+class LRUCache:
+    """
+    Cache LRU borné de surfaces pré-rendues.
+    hits / misses / evictions permettent de vérifier l'efficacité en charge.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def lookup(self, key):
+        s = self._items.get(key)
+        if s is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+        return s
+
+    def store(self, key, s):
+        self.misses += 1
+        self._items[key] = s
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+        return s
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = self.evictions = 0
+
 # ------------------------------ PARTICLES ---------------------------
-class Particle:
-    def __init__(self, pos, vel, life, radius, color):
-        self.x, self.y = pos
-        self.vx, self.vy = vel
-        self.life = life
-        self.max_life = life
-        self.radius = radius
-        self.color = color
+class SpriteCache(LRUCache):
+    """Sprites de particules pré-rendus, clé (rayon, couleur, alpha quantifié)."""
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.25
-        self.life -= 1
+    def __init__(self, max_size=SPRITE_CACHE_SIZE, alpha_step=ALPHA_STEP):
+        super().__init__(max_size)
+        self.alpha_step = alpha_step
 
-    def draw(self, surf):
-        alpha = max(10, int(255 * (self.life / self.max_life)))
-        s = pygame.Surface((self.radius*3, self.radius*3), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, alpha), (self.radius, self.radius), self.radius)
-        surf.blit(s, (self.x - self.radius, self.y - self.radius))
+    def quantize(self, alpha):
+        """Arrondit l'alpha au palier supérieur (fonctionne aussi sur un tableau NumPy)."""
+        step = self.alpha_step
+        return np.minimum(255, -(-alpha // step) * step)
+
+    def get(self, radius, color, alpha):
+        key = (radius, color, alpha)
+        s = self.lookup(key)
+        if s is not None:
+            return s
+        s = pygame.Surface((radius*2 + 1, radius*2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(s, (*color, alpha), (radius, radius), radius)
+        return self.store(key, s)
+
+
+# cache partagé : survit aux reset() du jeu
+PARTICLE_SPRITES = SpriteCache()
 
 class ParticleSystem:
-    def __init__(self):
-        self.ps = []
+    """
+    Particules stockées en structure de tableaux (SoA) NumPy préalloués.
+    - intégration + gravité vectorisées
+    - suppression des particules mortes par swap-remove (O(n))
+    - capacité fixe ; en cas de dépassement :
+        "recycle" -> écrase les particules les plus proches de la fin de vie
+        "drop"    -> ignore les nouvelles particules
+    """
+
+    def __init__(self, capacity=MAX_PARTICLES, overflow="recycle", sprites=None, seed=None):
+        if overflow not in ("recycle", "drop"):
+            raise ValueError(f"overflow inconnu: {overflow!r}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.sprites = sprites if sprites is not None else PARTICLE_SPRITES
+        self.count = 0
+        self.dropped = 0
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.max_life = np.ones(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+        self.rng = np.random.default_rng(seed)
+
+    def reset(self, seed=None):
+        """Vide le système en gardant les tableaux alloués."""
+        self.count = 0
+        self.dropped = 0
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    def _slots(self, amount):
+        """Indices où écrire `amount` nouvelles particules (selon la politique)."""
+        amount = min(amount, self.capacity)
+        free = self.capacity - self.count
+        if amount <= free:
+            idx = np.arange(self.count, self.count + amount)
+            self.count += amount
+            return idx
+        if self.overflow == "drop":
+            self.dropped += amount - free
+            idx = np.arange(self.count, self.capacity)
+            self.count = self.capacity
+            return idx
+        # recycle : on réutilise les particules qui vont mourir le plus tôt
+        over = amount - free
+        self.dropped += over
+        victims = np.argpartition(self.life[:self.count], over - 1)[:over]
+        idx = np.concatenate((np.arange(self.count, self.capacity), victims))
+        self.count = self.capacity
+        return idx
 
     def emit(self, pos, amount=8, color=(90,240,255)):
-        for _ in range(amount):
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-5, -2)
-            life = random.randint(20, 40)
-            r = random.randint(2, 5)
-            self.ps.append(Particle(pos, (vx, vy), life, r, color))
+        idx = self._slots(amount)
+        n = idx.size
+        if n == 0:
+            return
+        rng = self.rng
+        self.pos[idx] = pos
+        self.vel[idx, 0] = rng.uniform(-3, 3, n)
+        self.vel[idx, 1] = rng.uniform(-5, -2, n)
+        life = rng.integers(20, 41, n)
+        self.life[idx] = life
+        self.max_life[idx] = life
+        self.radius[idx] = rng.integers(2, 6, n)
+        self.color[idx] = color
 
     def update(self):
-        for p in self.ps[:]:
-            p.update()
-            if p.life <= 0:
-                self.ps.remove(p)
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.vel[:n, 1] += PARTICLE_GRAVITY
+        self.life[:n] -= 1
+
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if dead.size:
+            self._compact(dead, n)
+
+    def _compact(self, dead, n):
+        # swap-remove vectorisé : les survivants en fin de tableau bouchent
+        # les trous laissés par les particules mortes en début de tableau
+        alive = n - dead.size
+        holes = dead[dead < alive]
+        if holes.size:
+            tail = np.ones(n - alive, dtype=bool)
+            tail[dead[dead >= alive] - alive] = False
+            fillers = np.flatnonzero(tail) + alive
+            for arr in (self.pos, self.vel, self.life, self.max_life, self.radius, self.color):
+                arr[holes] = arr[fillers]
+        self.count = alive
+
+    def bounds(self):
+        """Boîte englobante (x, y, w, h) des sprites vivants, ou None."""
+        n = self.count
+        if n == 0:
+            return None
+        r = self.radius[:n, None]
+        lo = (self.pos[:n] - r).min(axis=0)
+        hi = (self.pos[:n] + r + 1).max(axis=0)
+        return (int(lo[0]) - 1, int(lo[1]) - 1, int(hi[0] - lo[0]) + 3, int(hi[1] - lo[1]) + 3)
 
     def draw(self, surf):
-        for p in self.ps:
-            p.draw(surf)
+        n = self.count
+        if n == 0:
+            return
+        cache = self.sprites
+        alpha = cache.quantize(np.maximum(10, (255 * self.life[:n]) // self.max_life[:n]))
+        r = self.radius[:n]
+        xy = (self.pos[:n] - r[:, None]).tolist()
+        get = cache.get
+        # un seul appel blits() par frame
+        surf.blits([
+            (get(rad, (cr, cg, cb), a), (x, y))
+            for (x, y), rad, (cr, cg, cb), a in zip(xy, r.tolist(), self.color[:n].tolist(), alpha.tolist())
+        ], False)
 
 # ------------------------------ PLAYER ------------------------------
-class Player:
-    def __init__(self):
-        self.x = 150
-        self.y = GROUND_Y - 64
-        self.w = 48
-        self.h = 64
-
-        self.vy = 0
-        self.on_ground = True
-        self.can_double = True
-        self.is_sliding = False
-        self.slide_timer = 0
-
-        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
-
-    def jump(self):
-        if self.on_ground:
-            self.vy = JUMP_FORCE
-            self.on_ground = False
-            self.can_double = True
-        elif self.can_double:
-            self.vy = DOUBLE_JUMP_FORCE
-            self.can_double = False
-
-    def slide(self):
-        if self.on_ground and not self.is_sliding:
-            self.is_sliding = True
-            self.slide_timer = SLIDE_TIME
+_PLAYER_RECT = pygame.Rect(0, 0, 0, 0)
 
-    def update(self):
-        self.vy += GRAVITY
-        self.y += self.vy
-
-        if self.y + self.h >= GROUND_Y:
-            self.y = GROUND_Y - self.h
-            self.vy = 0
-            self.on_ground = True
-            self.is_sliding = False
-        
-        if self.is_sliding:
-            self.slide_timer -= 1
-            if self.slide_timer <= 0:
-                self.is_sliding = False
-
-        # update hitbox
-        if self.is_sliding:
-            self.rect = pygame.Rect(self.x, self.y + self.h//2, self.w, self.h//2)
-        else:
-            self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
-
-    def draw(self, surf):
-        r = pygame.Rect(self.x, self.y, self.w, self.h)
-        pygame.draw.rect(surf, (130,100,255), r, border_radius=6)
-        pygame.draw.rect(surf, (90,255,220), (self.rect.x, self.rect.y, self.rect.width, 8))
+def draw_player(surf, player, dy=0):
+    r = _PLAYER_RECT
+    r.update(player.x, player.y + dy, player.w, player.h)
+    pygame.draw.rect(surf, (130,100,255), r, border_radius=6)
+    hx, hy, hw, hh = player.rect
+    pygame.draw.rect(surf, (90,255,220), (hx, hy + dy, hw, 8))
 
 # ------------------------------ OBSTACLES ----------------------------
-class Obstacle:
-    def __init__(self, x):
-        self.w = random.randint(40, 70)
-        self.h = random.randint(40, 100)
-        self.x = x
-        self.y = GROUND_Y - self.h
-        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
-        self.passed = False
-
-    def update(self, speed):
-        self.x -= speed
-        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
+def draw_obstacle(surf, ob, dx=0):
+    pygame.draw.rect(surf, (60,255,200), (ob.x + dx, ob.y, ob.w, ob.h), border_radius=8)
+
+# ------------------------------ TEXT --------------------------------
+class TextCache(LRUCache):
+    """
+    Textes rendus, clé (police, texte, couleur). Les nombres qui changent souvent
+    (score) sont composés de glyphes par chiffre : aucun miss quand ils changent.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        super().__init__(max_size)
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        s = self.lookup(key)
+        if s is not None:
+            return s
+        return self.store(key, font.render(text, True, color))
+
+    def blit_number(self, surf, font, value, pos, color, prefix=""):
+        """Dessine prefix + value glyphe par glyphe ; renvoie le Rect couvert."""
+        x, y = pos
+        parts = []
+        if prefix:
+            s = self.render(font, prefix, color)
+            parts.append((s, (x, y)))
+            x += s.get_width()
+        for ch in str(value):
+            s = self.render(font, ch, color)
+            parts.append((s, (x, y)))
+            x += s.get_width()
+        surf.blits(parts, False)
+        return pygame.Rect(pos, (x - pos[0], font.get_linesize()))
+
+# ------------------------------ RENDER ------------------------------
+class RectPool:
+    """Free-list de pygame.Rect : get() réutilise les rects de la frame précédente."""
 
-    def draw(self, surf):
-        pygame.draw.rect(surf, (60,255,200), (self.x, self.y, self.w, self.h), border_radius=8)
+    def __init__(self):
+        self.rects = []
+        self.used = 0
+
+    def clear(self):
+        self.used = 0
+
+    def get(self, x, y, w, h):
+        if self.used < len(self.rects):
+            r = self.rects[self.used]
+            r.update(x, y, w, h)
+        else:
+            r = pygame.Rect(x, y, w, h)
+            self.rects.append(r)
+        self.used += 1
+        return r
+
+
+class LayeredRenderer:
+    """
+    Mode de rendu "dirty" pour machines lentes :
+    - fond + parallax + sol pré-rendus une fois dans une bande de WIDTH + STRIPE_PERIOD
+    - chaque frame, seules les zones sales (anciennes et nouvelles boîtes des entités,
+      HUD, bords des bandes parallax qui ont bougé) sont restaurées depuis la bande
+    - présentation via display.update(rects) au lieu de display.flip()
+    Redessin complet au changement d'état ou quand le décalage saute.
+    """
+
+    MAX_EDGE_SHIFT = 16
+
+    def __init__(self, hud_size=(280, 32)):
+        self.strip = pygame.Surface((WIDTH + STRIPE_PERIOD, HEIGHT)).convert()
+        self.strip.fill(BG_COLOR)
+        for i in range(WIDTH // STRIPE_PERIOD + 2):
+            pygame.draw.rect(self.strip, STRIPE_COLOR, (i*STRIPE_PERIOD, 0, STRIPE_WIDTH, HEIGHT))
+        pygame.draw.rect(self.strip, GROUND_COLOR, (0, GROUND_Y, WIDTH + STRIPE_PERIOD, HEIGHT - GROUND_Y))
+
+        self.hud = pygame.Rect((10, 10), hud_size)
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.prev_rects = []
+        # deux pools alternés : prev_rects doit survivre une frame de plus
+        self.pools = (RectPool(), RectPool())
+        self.pool_index = 0
+        self.prev_state = None
+        self.prev_off = None
+        self.prev_forced = False
+        self.off = 0
+        self.mode = "full"
+        self.dirty = []
+
+    @staticmethod
+    def offset(frame):
+        return int(frame * PARALLAX % STRIPE_PERIOD)
+
+    def entity_rects(self, game):
+        dx, dy = game.view_offsets()
+        self.pool_index ^= 1
+        pool = self.pools[self.pool_index]
+        pool.clear()
+        p = game.player
+        rects = [pool.get(p.x - 1, p.y + dy - 1, p.w + 2, p.h + 2)]
+        for ob in game.obstacles:
+            rects.append(pool.get(ob.x + dx - 1, ob.y - 1, ob.w + 2, ob.h + 2))
+        b = game.particles.bounds()
+        if b:
+            rects.append(pool.get(*b))
+        screen = self.screen_rect
+        for i, r in enumerate(rects):
+            if not screen.contains(r):
+                rects[i] = r.clip(screen)
+        if game.state == "PLAY":
+            rects.append(self.hud)
+        return rects
+
+    def edge_rects(self, shift):
+        # les bandes ont glissé de `shift` px vers la gauche : seules leurs arêtes changent
+        rects = []
+        for i in range(WIDTH // STRIPE_PERIOD + 2):
+            left = i*STRIPE_PERIOD - self.prev_off
+            for edge in (left, left + STRIPE_WIDTH):
+                r = pygame.Rect(edge - shift, 0, shift, GROUND_Y).clip(self.screen_rect)
+                if r.width:
+                    rects.append(r)
+        return rects
+
+    def begin(self, game, force_full=False):
+        """Restaure le fond ; renvoie False s'il n'y a rien à redessiner."""
+        self.off = off = self.offset(game.view_frame())
+        rects = self.entity_rects(game)
+        shift = None if self.prev_off is None else (off - self.prev_off) % STRIPE_PERIOD
+
+        full = (force_full or self.prev_forced or game.state != self.prev_state
+                or shift is None or shift > self.MAX_EDGE_SHIFT)
+        if full:
+            self.mode = "full"
+            game.screen.blit(self.strip, (-off, 0))
+        elif game.state != "PLAY":
+            # écran figé (titre, pause, game over) : rien ne bouge
+            self.mode = "none"
+        else:
+            self.mode = "partial"
+            self.dirty = self.prev_rects + rects
+            if shift:
+                self.dirty += self.edge_rects(shift)
+            blit = game.screen.blit
+            for r in self.dirty:
+                blit(self.strip, r, r.move(off, 0))
+
+        self.prev_rects = rects
+        self.prev_state = game.state
+        self.prev_off = off
+        self.prev_forced = force_full
+        return self.mode != "none"
+
+    def present(self):
+        if self.mode == "full":
+            pygame.display.flip()
+        elif self.mode == "partial":
+            pygame.display.update(self.dirty)
 
 # ------------------------------ GAME --------------------------------
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, tuning=DEFAULT_TUNING, profile=False, render=None, tick_rate=TICK_RATE, fps=FPS):
+        self.tuning = tuning
+        # pas fixe : la simulation avance par ticks de tick_ms, l'affichage à `fps`
+        self.tick_ms = 1000 / tick_rate
+        self.fps = fps
+        self.time_scale = 1.0
+        self.acc = 0.0
+        self.alpha = 1.0
+        # profilage optionnel (F3 overlay, F4 export) : None = coût nul
+        self.profiler = FrameProfiler() if profile or os.environ.get("CYBER_RUNNER_PROFILE") else None
+        # "full" : tout redessiner chaque frame ; "dirty" : couches en cache + display.update(rects)
+        self.render_mode = render or os.environ.get("CYBER_RUNNER_RENDER", "full")
+        # pas de pygame.init() : le mixer est ouvert par sons.SONS, les effets préparés en arrière-plan
+        pygame.display.init()
+        pygame.font.init()
+        SONS.precharger()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Cyber Runner Prime")
         self.clock = pygame.time.Clock()
 
         self.font = pygame.font.SysFont(FONT_NAME, 26)
         self.big = pygame.font.SysFont(FONT_NAME, 48, bold=True)
+        self.mono = pygame.font.SysFont("monospace", 14) if self.profiler else None
+        self.text = TextCache()
+        self.layers = LayeredRenderer() if self.render_mode == "dirty" else None
+
+        # pools réutilisés d'une partie à l'autre
+        self.obstacle_pool = ObstaclePool()
+        self.particles = None
+        self.sim = None
+        self.gc_mode = GC_MODE
+        self._state = None
+        self.patterns = self.pattern_library()
 
         self.reset()
         self.state = "TITLE"
         self.high = load_high()
 
-    def reset(self):
-        self.player = Player()
-        self.particles = ParticleSystem()
-        self.obstacles = []
-        self.speed = 8
-        self.timer = SPAWN_RATE
-        self.score = 0
-        self.frame = 0
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        # tas de démarrage gelé (ou GC coupé) pendant PLAY, collecte en sortant de PLAY
+        was_playing = self._state == "PLAY"
+        self._state = value
+        if value == "PLAY" and not was_playing:
+            gc_enter_play(self.gc_mode)
+        elif was_playing and value != "PLAY":
+            gc_leave_play(self.gc_mode)
+
+    def pattern_library(self):
+        # motifs vérifiés (python runner_patterns.py build) s'ils existent pour ce tuning,
+        # sinon un obstacle au hasard à chaque spawn
+        return load_patterns(PATTERNS_FILE, self.tuning)
+
+    def reset(self, seed=None):
+        # une seed par partie : la partie est rejouable à l'identique
+        self.seed = random.getrandbits(32) if seed is None else seed
+        if self.sim is not None:
+            self.sim.recycle()
+        self.sim = RunnerSim(seed=self.seed, tuning=self.tuning, pool=self.obstacle_pool,
+                             patterns=self.patterns)
+        if self.particles is None:
+            self.particles = ParticleSystem(seed=self.seed)
+        else:
+            self.particles.reset(self.seed)
+        self.recorder = Recorder(self.seed, self.tuning, self.patterns)
+        self.acc = 0.0
+        self.alpha = 1.0
+        self.prev_y = self.player.y
+        self.prev_scroll = self.obstacles.scroll
+
+    # Vues sur l'état de la simulation
+    @property
+    def player(self):
+        return self.sim.player
+
+    @property
+    def obstacles(self):
+        return self.sim.obstacles
+
+    @property
+    def score(self):
+        return self.sim.score
+
+    @property
+    def frame(self):
+        return self.sim.frame
+
+    # Interpolation entre les deux derniers ticks (alpha = fraction du tick en cours)
+    def view_offsets(self):
+        """(dx obstacles, dy joueur) à ajouter aux positions du dernier tick."""
+        k = 1 - self.alpha
+        return (self.obstacles.scroll - self.prev_scroll) * k, (self.prev_y - self.player.y) * k
+
+    def view_frame(self):
+        return self.frame - (1 - self.alpha)
 
     # ----------------------------- BACKGROUND ------------------------
     def draw_background(self):
-        self.screen.fill((10,10,25))
+        self.screen.fill(BG_COLOR)
         for i in range(5):
-            x = (i*220 - (self.frame*0.6 % 220))
-            pygame.draw.rect(self.screen, (18,18,40), (x,0,160,HEIGHT))
-        pygame.draw.rect(self.screen, (20,20,35), (0,GROUND_Y,WIDTH,HEIGHT-GROUND_Y))
-
-    # ----------------------------- SPAWN -----------------------------
-    def spawn_obstacle(self):
-        self.obstacles.append(Obstacle(WIDTH + 20))
+            x = (i*STRIPE_PERIOD - (self.view_frame()*PARALLAX % STRIPE_PERIOD))
+            pygame.draw.rect(self.screen, STRIPE_COLOR, (x,0,STRIPE_WIDTH,HEIGHT))
+        pygame.draw.rect(self.screen, GROUND_COLOR, (0,GROUND_Y,WIDTH,HEIGHT-GROUND_Y))
 
-    # ----------------------------- UPDATE ----------------------------
-    def update_play(self):
+    # ----------------------------- INPUT -----------------------------
+    def read_input(self):
         keys = pygame.key.get_pressed()
-
+        inputs = INPUT_NONE
         if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
-            if self.player.on_ground:
-                self.player.jump()
+            inputs |= INPUT_JUMP
         if keys[pygame.K_DOWN]:
-            self.player.slide()
-
-        # update entities
-        self.player.update()
-        self.particles.update()
-
-        for ob in self.obstacles[:]:
-            ob.update(self.speed)
-            if ob.x + ob.w < 0:
-                self.obstacles.remove(ob)
+            inputs |= INPUT_SLIDE
+        return inputs
 
-            if ob.rect.colliderect(self.player.rect):
-                self.state = "GAMEOVER"
-                self.particles.emit((self.player.x+20, self.player.y+30), 30)
-                if self.score > self.high:
-                    self.high = self.score
-                    save_high(self.high)
-
-            if not ob.passed and ob.x + ob.w < self.player.x:
-                ob.passed = True
-                self.score += 15
-
-        # spawn logic
-        self.timer -= 1
-        if self.timer <= 0:
-            self.spawn_obstacle()
-            self.timer = max(40, int(SPAWN_RATE - self.frame * SPEED_GROWTH))
+    # ----------------------------- UPDATE ----------------------------
+    def advance(self, dt, prof=None):
+        """
+        Accumulateur à pas fixe : exécute les ticks dus pour dt ms réels
+        (au plus MAX_CATCHUP par frame, le retard au-delà est abandonné).
+        """
+        if self.state != "PLAY":
+            self.acc = 0.0
+            self.alpha = 1.0
+            return 0
+        self.acc += dt * self.time_scale
+        max_steps = max(1, int(MAX_CATCHUP * self.time_scale))
+        steps = 0
+        while self.acc >= self.tick_ms and self.state == "PLAY":
+            if steps == max_steps:
+                self.acc %= self.tick_ms
+                break
+            self.acc -= self.tick_ms
+            self.prev_y = self.player.y
+            self.prev_scroll = self.obstacles.scroll
+            self.update_play()
+            if prof:
+                prof.lap("update_play")
+            self.particles.update()
+            if prof:
+                prof.lap("particles")
+            steps += 1
+        self.alpha = self.acc / self.tick_ms if self.state == "PLAY" else 1.0
+        return steps
 
-        self.frame += 1
-        self.speed += SPEED_GROWTH
+    def update_play(self):
+        inputs = self.read_input()
+        self.recorder.record(inputs)
+        events = self.sim.step(inputs)
+
+        if events & EVENT_JUMP:
+            SONS.jouer("saut")
+        if events & EVENT_CRASH:
+            SONS.jouer("crash")
+            self.game_over()
+
+    def game_over(self):
+        self.state = "GAMEOVER"
+        self.particles.emit((self.player.x+20, self.player.y+30), 30)
+        if self.score > self.high:
+            self.high = self.score
+            save_high(self.high)
+        try:
+            self.recorder.finish(self.sim).save(REPLAY_FILE)
+        except OSError:
+            pass
 
     # ----------------------------- DRAW ------------------------------
     def draw_entities(self):
+        dx, dy = self.view_offsets()
         for ob in self.obstacles:
-            ob.draw(self.screen)
-        self.player.draw(self.screen)
+            draw_obstacle(self.screen, ob, dx)
+        draw_player(self.screen, self.player, dy)
         self.particles.draw(self.screen)
 
     def draw_text_center(self, txt, sub=None):
-        s = self.big.render(txt, True, (255,255,255))
+        s = self.text.render(self.big, txt, (255,255,255))
         r = s.get_rect(center=(WIDTH//2, HEIGHT//2 - 20))
         self.screen.blit(s, r)
         if sub:
-            ss = self.font.render(sub, True, (230,230,230))
+            ss = self.text.render(self.font, sub, (230,230,230))
             rr = ss.get_rect(center=(WIDTH//2, HEIGHT//2 + 30))
             self.screen.blit(ss, rr)
 
+    def draw_texts(self):
+        if self.state == "TITLE":
+            self.draw_text_center("CYBER RUNNER PRIME", "Appuyez sur ESPACE pour démarrer")
+        elif self.state == "PAUSE":
+            self.draw_text_center("PAUSE", "Appuyez sur P pour reprendre")
+        elif self.state == "GAMEOVER":
+            self.draw_text_center("GAME OVER", f"Score: {self.score} | Meilleur: {self.high} | Appuyez sur R pour rejouer")
+        # HUD
+        if self.state == "PLAY":
+            self.text.blit_number(self.screen, self.font, self.score, (10,10), (255,255,255), "Score: ")
+
     # ----------------------------- MAIN LOOP --------------------------
+    def export_profile(self):
+        self.profiler.export_csv(PROFILE_FILE + ".csv")
+        self.profiler.export_json(PROFILE_FILE + ".json")
+
     def run(self):
+        prof = self.profiler
         running = True
         while running:
-            dt = self.clock.tick(FPS)
+            dt = self.clock.tick(self.fps)
+            if prof:
+                prof.start()
 
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
@@ -281,25 +702,83 @@ class Game:
                         if self.state == "PLAY":
                             self.state = "PAUSE"
                         elif self.state == "PAUSE":
-                            self.state = "PLAY" 
-            # Update
-            if self.state == "PLAY":
-                self.update_play()          
+                            self.state = "PLAY"
+
+                    elif prof and e.key == pygame.K_F3:
+                        prof.show = not prof.show
+                    elif prof and e.key == pygame.K_F4:
+                        self.export_profile()
+            if prof:
+                prof.lap("events")
+            # Update (pas fixe)
+            self.advance(dt, prof)
             # Draw
-            self.draw_background()
-            self.draw_entities()
-            if self.state == "TITLE":
-                self.draw_text_center("CYBER RUNNER PRIME", "Appuyez sur ESPACE pour démarrer")
-            elif self.state == "PAUSE":
-                self.draw_text_center("PAUSE", "Appuyez sur P pour reprendre")
-            elif self.state == "GAMEOVER":
-                self.draw_text_center("GAME OVER", f"Score: {self.score} | Meilleur: {self.high} | Appuyez sur R pour rejouer")
-            # HUD
-            if self.state == "PLAY":
-                score_surf = self.font.render(f"Score: {self.score}", True, (255,255,255))
-                self.screen.blit(score_surf, (10,10))
-            pygame.display.flip()
+            layers = self.layers
+            if layers:
+                redraw = layers.begin(self, force_full=bool(prof and prof.show))
+            else:
+                redraw = True
+                self.draw_background()
+            if prof:
+                prof.lap("draw_background")
+            if redraw:
+                self.draw_entities()
+            if prof:
+                prof.lap("draw_entities")
+            if redraw:
+                self.draw_texts()
+            if prof:
+                prof.lap("text")
+                if prof.show:
+                    prof.draw(self.screen, self.mono)
+                prof.lap("overlay")
+            if layers:
+                layers.present()
+            else:
+                pygame.display.flip()
+            if prof:
+                prof.lap("flip")
+                prof.end()
+        if prof:
+            self.export_profile()
+        # le thread des sons ne doit plus toucher au mixer quand pygame le ferme
+        SONS.attendre()
         pygame.quit()
+
+# ------------------------------ REPLAY ------------------------------
+class ReplayGame(Game):
+    """Affiche un runner_replay.Replay à `speed` fois la vitesse normale (R pour relancer)."""
+
+    def __init__(self, replay, speed=1.0):
+        self.replay = replay
+        super().__init__(replay.tuning)
+        self.time_scale = speed
+        self.state = "PLAY"
+
+    def pattern_library(self):
+        return replay_patterns(self.replay)
+
+    def reset(self, seed=None):
+        super().reset(self.replay.seed)
+        self.valid = None
+
+    def read_input(self):
+        return self.replay.inputs[self.frame]
+
+    def update_play(self):
+        if self.frame >= len(self.replay.inputs):
+            self.game_over()
+            return
+        super().update_play()
+
+    def game_over(self):
+        self.state = "GAMEOVER"
+        self.particles.emit((self.player.x+20, self.player.y+30), 30)
+        self.valid = (self.score, self.frame) == (self.replay.score, self.replay.frames)
+        pygame.display.set_caption(
+            f"Cyber Runner Prime - replay {'valide' if self.valid else 'DIVERGENT'}")
+
+
 if __name__ == "__main__":
     game = Game()
     game.run()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Nombres en lettres françaises
+- Entiers de taille arbitraire : mille, million, milliard, billion, ... décilliard,
+  puis composition ("mille décilliards") au-delà
+- Découpage en groupes de 3 chiffres, écritures de groupes en cache :
+  temps linéaire en nombre de chiffres (hors conversion de l'entier en décimal)
+- Table précalculée 0..9999 (construite au premier appel) : lookup O(1)
+- Hors table : chemin mémoïsé
+- API en masse pour convertir des séquences ou des plages entières
+  (feuilles de réponses imprimées, plusieurs centaines de milliers de nombres)
+
+  python nombres_fr.py bench      # 10^6 entiers 64 bits aléatoires
+  python nombres_fr.py verifier   # 0..10^6 contre une implémentation de référence
+"""
+
+import random
+import sys
+import time
+from functools import lru_cache
+
+TAILLE_TABLE = 10000
+
+UNITÉS = [
+    "", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf"
+]
+SPÉCIAUX = {
+    10: "dix", 11: "onze", 12: "douze", 13: "treize", 14: "quatorze",
+    15: "quinze", 16: "seize"
+}
+DIZAINES = [
+    "", "", "vingt", "trente", "quarante", "cinquante", "soixante"
+]
+# échelle longue : 10^(3*i) ; "mille" est invariable, les suivants sont des noms
+ÉCHELLES = [
+    "", "mille", "million", "milliard", "billion", "billiard", "trillion", "trilliard",
+    "quadrillion", "quadrilliard", "quintillion", "quintilliard", "sextillion", "sextilliard",
+    "septillion", "septilliard", "octillion", "octilliard", "nonillion", "nonilliard",
+    "décillion", "décilliard",
+]
+CHIFFRES_MAX = 3 * len(ÉCHELLES)
+BLOC = CHIFFRES_MAX - 3    # chiffres sous le décilliard
+
+
+# -------------------------
+# Calcul direct
+# -------------------------
+def deux_chiffres(x):
+    if x < 10:
+        return UNITÉS[x]
+    if 10 <= x <= 16:
+        return SPÉCIAUX[x]
+    if 17 <= x <= 19:
+        return "dix-" + UNITÉS[x - 10]
+    if 20 <= x <= 69:
+        d = x // 10
+        u = x % 10
+        base = DIZAINES[d]
+        if u == 1:
+            return base + "-et-un"
+        elif u > 0:
+            return base + "-" + UNITÉS[u]
+        else:
+            return base
+    if 70 <= x <= 79:
+        # 70 = soixante-dix, 71 = soixante-et-onze, ...
+        rest = x - 60
+        if rest == 11:
+            return "soixante-et-onze"
+        return "soixante-" + deux_chiffres(rest)
+    if 80 <= x <= 99:
+        # 80 = quatre-vingts (sans 's' si suite), 81 = quatre-vingt-un
+        rest = x - 80
+        if rest == 0:
+            return "quatre-vingts"
+        else:
+            return "quatre-vingt-" + deux_chiffres(rest)
+    return ""
+
+
+def trois_chiffres(x):
+    if x < 100:
+        return deux_chiffres(x)
+    h = x // 100
+    rest = x % 100
+    if h == 1:
+        prefix = "cent"
+    else:
+        prefix = UNITÉS[h] + " cent"
+    if rest == 0:
+        # cent(s) prend un 's' quand il est multiple exact et >1
+        if h > 1:
+            return prefix + "s"
+        return prefix
+    return prefix + " " + deux_chiffres(rest)
+
+
+# écritures de groupes déjà calculées : _GROUPES[i][g]
+_GROUPES = [[None] * 1000 for _ in ÉCHELLES]
+LIMITE_ENTIER = 10 ** CHIFFRES_MAX
+
+
+def groupe(g, i):
+    """Écriture (en cache) du groupe g (0..999) à l'échelle 10^(3*i), i < len(ÉCHELLES)."""
+    mots = _GROUPES[i][g]
+    if mots is None:
+        mots = _GROUPES[i][g] = _ecrire_groupe(g, i)
+    return mots
+
+
+def _ecrire_groupe(g, i):
+    mots = trois_chiffres(g)
+    if i == 0:
+        return mots
+    if i == 1:
+        if g == 1:
+            return "mille"
+        # cent / quatre-vingt restent invariables devant mille : deux cent mille
+        if mots.endswith(("cents", "vingts")):
+            mots = mots[:-1]
+        return mots + " mille"
+    return mots + " " + ÉCHELLES[i] + ("s" if g > 1 else "")
+
+
+def _chiffres(n):
+    """str(n), y compris au-delà de la limite de conversion de CPython."""
+    try:
+        return str(n)
+    except ValueError:
+        k = n.bit_length() * 3 // 20     # ~ la moitié des chiffres
+        haut, bas = divmod(n, 10 ** k)
+        return _chiffres(haut) + _chiffres(bas).zfill(k)
+
+
+def _depuis_chiffres(d):
+    """
+    Écriture d'un nombre > 0 donné par ses chiffres décimaux.
+    Au-delà du décilliard : une tête d'au plus CHIFFRES_MAX chiffres, puis des blocs de
+    BLOC chiffres lus de gauche à droite ; chaque bloc multiplie tout ce qui le précède
+    par un décilliard ("<tête> décilliards de décilliards <bloc> décilliards <bloc>").
+    """
+    if len(d) <= CHIFFRES_MAX:
+        return _groupes(d)
+    coupe = len(d) - BLOC * -(-(len(d) - CHIFFRES_MAX) // BLOC)
+    mots = _groupes(d[:coupe])
+    parties = [mots]
+    dernier = mots.rsplit(" ", 1)[-1]
+    for pos in range(coupe, len(d), BLOC):
+        lien = " de " if dernier.rstrip("s") in ÉCHELLES[2:] else " "
+        un = len(parties) == 1 and mots == "un"
+        parties.append(lien + ÉCHELLES[-1] + ("" if un else "s"))
+        dernier = ÉCHELLES[-1]
+        reste = d[pos:pos + BLOC]
+        if reste.strip("0"):
+            mots = _groupes(reste)
+            parties.append(" " + mots)
+            dernier = mots.rsplit(" ", 1)[-1]
+    return "".join(parties)
+
+
+def _groupes(d):
+    """Écriture de 0 < d < 10^CHIFFRES_MAX donné par ses chiffres (zéros de tête tolérés)."""
+    premier = len(d) % 3 or 3
+    k = (len(d) - premier) // 3
+    mots = []
+    g = int(d[:premier])
+    if g:
+        mots.append(_GROUPES[k][g] or groupe(g, k))
+    for pos in range(premier, len(d), 3):
+        k -= 1
+        g = int(d[pos:pos + 3])
+        if g:
+            mots.append(_GROUPES[k][g] or groupe(g, k))
+    return " ".join(mots)
+
+
+def _depuis_entier(n):
+    """Écriture d'un 0 < n < 10^CHIFFRES_MAX par divmod successifs (rapide sur les petits entiers)."""
+    mots = []
+    i = 0
+    while n:
+        n, g = divmod(n, 1000)
+        if g:
+            mots.append(_GROUPES[i][g] or groupe(g, i))
+        i += 1
+    mots.reverse()
+    return " ".join(mots)
+
+
+def _calculer(n):
+    """Conversion sans table (n >= 0)."""
+    if n == 0:
+        return "zéro"
+    if n < LIMITE_ENTIER:
+        return _depuis_entier(n)
+    return _depuis_chiffres(_chiffres(n))
+
+
+# -------------------------
+# Table et mémoïsation
+# -------------------------
+_table = None
+
+
+def table():
+    """Liste des écritures de 0..TAILLE_TABLE-1, construite une seule fois."""
+    global _table
+    if _table is None:
+        _table = [_calculer(n) for n in range(TAILLE_TABLE)]
+    return _table
+
+
+@lru_cache(maxsize=65536)
+def _hors_table(n):
+    return _calculer(n)
+
+
+def nombre_en_lettres(n: int) -> str:
+    """
+    Convertit un entier (taille arbitraire) en représentation littérale française.
+    O(1) pour 0..9999 (table), linéaire en nombre de chiffres et mémoïsé au-delà.
+    """
+    if n < 0:
+        return "moins " + nombre_en_lettres(-n)
+    if n < TAILLE_TABLE:
+        return table()[n]
+    return _hors_table(n)
+
+
+def affichage_nombre(n: int) -> str:
+    """Renvoie '12 (douze)'"""
+    return f"{n} ({nombre_en_lettres(n)})"
+
+
+# -------------------------
+# API en masse
+# -------------------------
+def nombres_en_lettres(nombres):
+    """Convertit une séquence (ou tout itérable) d'entiers ; renvoie une liste."""
+    t = table()
+    return [t[n] if 0 <= n < TAILLE_TABLE else nombre_en_lettres(n) for n in nombres]
+
+
+def plage_en_lettres(debut, fin, pas=1):
+    """Équivalent de nombres_en_lettres(range(debut, fin, pas)), par tranche de table si possible."""
+    r = range(debut, fin, pas)
+    if not r:
+        return []
+    if pas > 0 and r[0] >= 0 and r[-1] < TAILLE_TABLE:
+        return table()[r[0]:r[-1] + 1:pas]
+    return nombres_en_lettres(r)
+
+
+def affichages_nombres(nombres):
+    """Version en masse de affichage_nombre."""
+    nombres = list(nombres)
+    return [f"{n} ({l})" for n, l in zip(nombres, nombres_en_lettres(nombres))]
+
+
+# -------------------------
+# Benchmark et vérification
+# -------------------------
+def _reference(n):
+    """Implémentation de référence, récursive sur la valeur (lente, indépendante des caches)."""
+    if n == 0:
+        return "zéro"
+
+    def moins_de_cent(x):
+        if x < 17:
+            return ["", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf",
+                    "dix", "onze", "douze", "treize", "quatorze", "quinze", "seize"][x]
+        if x < 20:
+            return "dix-" + moins_de_cent(x - 10)
+        d, u = divmod(x, 10)
+        if d in (7, 9):
+            d, u = d - 1, u + 10
+        base = {2: "vingt", 3: "trente", 4: "quarante", 5: "cinquante", 6: "soixante", 8: "quatre-vingt"}[d]
+        if u == 0:
+            return base + ("s" if d == 8 else "")
+        if u in (1, 11) and d != 8:
+            return base + "-et-" + moins_de_cent(u)
+        return base + "-" + moins_de_cent(u)
+
+    def moins_de_mille(x, devant_mille=False):
+        c, r = divmod(x, 100)
+        if c == 0:
+            mots = moins_de_cent(r)
+        else:
+            mots = ("cent" if c == 1 else moins_de_cent(c) + " cent")
+            mots += (" " + moins_de_cent(r)) if r else ("s" if c > 1 else "")
+        if devant_mille and mots.endswith("s") and mots.endswith(("cents", "vingts")):
+            mots = mots[:-1]
+        return mots
+
+    mots = []
+    for i in range(len(ÉCHELLES) - 1, 1, -1):
+        q, n = divmod(n, 1000 ** i)
+        if q:
+            mots.append(moins_de_mille(q) + " " + ÉCHELLES[i] + ("s" if q > 1 else ""))
+    q, n = divmod(n, 1000)
+    if q:
+        mots.append("mille" if q == 1 else moins_de_mille(q, True) + " mille")
+    if n:
+        mots.append(moins_de_mille(n))
+    return " ".join(mots)
+
+
+def bench(nb=1_000_000, seed=0):
+    rng = random.Random(seed)
+    valeurs = [rng.getrandbits(64) for _ in range(nb)]
+    t0 = time.perf_counter()
+    for v in valeurs:
+        _calculer(v)
+    dt = time.perf_counter() - t0
+    en_cache = sum(g is not None for ligne in _GROUPES for g in ligne)
+    print(f"{nb} entiers 64 bits : {dt:.2f} s ({nb / dt:,.0f} /s), "
+          f"{en_cache} écritures de groupes en cache")
+
+
+def verifier(fin=1_000_000):
+    erreurs = 0
+    for n in range(fin + 1):
+        if nombre_en_lettres(n) != _reference(n):
+            erreurs += 1
+            if erreurs <= 10:
+                print(f"{n}: {nombre_en_lettres(n)!r} != {_reference(n)!r}")
+    print(f"0..{fin} : {erreurs} écart(s)")
+    return erreurs == 0
+
+
+if __name__ == "__main__":
+    commande = sys.argv[1] if len(sys.argv) > 1 else "bench"
+    if commande == "bench":
+        bench()
+    elif commande == "verifier":
+        sys.exit(0 if verifier() else 1)
+    else:
+        print(__doc__)
@@ -0,0 +1,187 @@
+# Cyber Runner Prime - Simulation par lots (NumPy)
+# - N parties indépendantes avancées ensemble, état stocké en tableaux
+# - Même physique que runner_sim.RunnerSim (saut, glissade, apparition, accélération)
+# - Collisions AABB vectorisées joueur / obstacles
+# - Constantes de tuning scalaires ou par partie (balayages Monte Carlo)
+
+import time
+
+import numpy as np
+
+from runner_sim import (
+    WIDTH, GROUND_Y, GRAVITY,
+    JUMP_FORCE, DOUBLE_JUMP_FORCE, SLIDE_TIME,
+    SPAWN_RATE, SPEED_GROWTH, START_SPEED, MIN_SPAWN_INTERVAL, PASS_SCORE,
+    INPUT_NONE, INPUT_JUMP, INPUT_SLIDE, DEFAULT_TUNING,
+)
+
+PLAYER_X, PLAYER_W, PLAYER_H = 150, 48, 64
+MAX_OBSTACLES = 8
+
+
+class RunnerBatch:
+    """
+    n parties de Cyber Runner en parallèle. Chaque paramètre de tuning peut être
+    un scalaire ou un tableau de taille n. step(inputs) prend un masque d'entrées
+    par partie ; les parties terminées sont figées (alive == False).
+    """
+
+    def __init__(self, n, seed=None, gravity=GRAVITY, jump_force=JUMP_FORCE,
+                 double_jump_force=DOUBLE_JUMP_FORCE, slide_time=SLIDE_TIME,
+                 spawn_rate=SPAWN_RATE, speed_growth=SPEED_GROWTH,
+                 max_obstacles=MAX_OBSTACLES):
+        self.n = n
+        self.k = max_obstacles
+        self.rng = np.random.default_rng(seed)
+
+        def per_run(v, dtype=np.float64):
+            return np.broadcast_to(np.asarray(v, dtype=dtype), (n,)).copy()
+
+        self.gravity = per_run(gravity)
+        self.jump_force = per_run(jump_force)
+        self.double_jump_force = per_run(double_jump_force)
+        self.slide_time = per_run(slide_time, np.int32)
+        self.spawn_rate = per_run(spawn_rate)
+        self.speed_growth = per_run(speed_growth)
+
+        self.reset()
+
+    @classmethod
+    def from_tuning(cls, n, tuning=DEFAULT_TUNING, seed=None, **kwargs):
+        """Lot de n parties partageant le même runner_sim.Tuning."""
+        return cls(n, seed=seed, gravity=tuning.gravity, jump_force=tuning.jump_force,
+                   double_jump_force=tuning.double_jump_force, slide_time=tuning.slide_time,
+                   spawn_rate=tuning.spawn_rate, speed_growth=tuning.speed_growth, **kwargs)
+
+    def reset(self):
+        n, k = self.n, self.k
+        # joueur
+        self.y = np.full(n, GROUND_Y - PLAYER_H, dtype=np.float64)
+        self.vy = np.zeros(n)
+        self.on_ground = np.ones(n, dtype=bool)
+        self.can_double = np.ones(n, dtype=bool)
+        self.sliding = np.zeros(n, dtype=bool)
+        self.slide_timer = np.zeros(n, dtype=np.int32)
+        # obstacles (k emplacements par partie)
+        self.ox = np.zeros((n, k))
+        self.ow = np.zeros((n, k))
+        self.oh = np.zeros((n, k))
+        self.active = np.zeros((n, k), dtype=bool)
+        self.passed = np.zeros((n, k), dtype=bool)
+        # niveau
+        self.speed = np.full(n, float(START_SPEED))
+        self.timer = self.spawn_rate.astype(np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.frame = np.zeros(n, dtype=np.int64)
+        self.alive = np.ones(n, dtype=bool)
+        self.dropped_spawns = 0
+
+    # ----------------------------- STEP ------------------------------
+    def step(self, inputs=INPUT_NONE):
+        live = self.alive
+        inputs = np.broadcast_to(np.asarray(inputs), (self.n,))
+
+        # entrées : saut au sol uniquement (comme Game), puis glissade
+        jump = live & ((inputs & INPUT_JUMP) != 0) & self.on_ground
+        self.vy[jump] = self.jump_force[jump]
+        self.on_ground[jump] = False
+        self.can_double[jump] = True
+
+        slide = live & ((inputs & INPUT_SLIDE) != 0) & self.on_ground & ~self.sliding
+        self.sliding[slide] = True
+        self.slide_timer[slide] = self.slide_time[slide]
+
+        # physique du joueur
+        self.vy += np.where(live, self.gravity, 0.0)
+        self.y += np.where(live, self.vy, 0.0)
+        landed = live & (self.y + PLAYER_H >= GROUND_Y)
+        self.y[landed] = GROUND_Y - PLAYER_H
+        self.vy[landed] = 0
+        self.on_ground[landed] = True
+        self.sliding[landed] = False
+
+        self.slide_timer -= self.sliding & live
+        self.sliding &= self.slide_timer > 0
+
+        # hitbox joueur
+        half = PLAYER_H // 2
+        hy = np.where(self.sliding, self.y + half, self.y)[:, None]
+        hh = np.where(self.sliding, half, PLAYER_H)[:, None]
+
+        # obstacles
+        moving = self.active & live[:, None]
+        self.ox -= np.where(moving, self.speed[:, None], 0.0)
+        oy = GROUND_Y - self.oh
+        hit = (moving
+               & (self.ox < PLAYER_X + PLAYER_W) & (PLAYER_X < self.ox + self.ow)
+               & (oy < hy + hh) & (hy < oy + self.oh))
+        crash = hit.any(axis=1)
+
+        newly_passed = moving & ~self.passed & (self.ox + self.ow < PLAYER_X)
+        self.passed |= newly_passed
+        self.score += PASS_SCORE * newly_passed.sum(axis=1)
+        self.active &= ~(moving & (self.ox + self.ow < 0))
+
+        # apparition
+        self.timer -= live
+        spawn = live & (self.timer <= 0)
+        if spawn.any():
+            self._spawn(np.flatnonzero(spawn))
+
+        self.frame += live
+        self.speed += np.where(live, self.speed_growth, 0.0)
+        self.alive = live & ~crash
+        return crash
+
+    def _spawn(self, rows):
+        free = ~self.active[rows]
+        has_slot = free.any(axis=1)
+        self.dropped_spawns += int((~has_slot).sum())
+        ok = rows[has_slot]
+        slot = free[has_slot].argmax(axis=1)
+        m = ok.size
+        self.ox[ok, slot] = WIDTH + 20
+        self.ow[ok, slot] = self.rng.integers(40, 71, m)
+        self.oh[ok, slot] = self.rng.integers(40, 101, m)
+        self.active[ok, slot] = True
+        self.passed[ok, slot] = False
+        # le timer est réarmé même si l'emplacement manque, comme RunnerSim
+        frame = self.frame[rows]
+        self.timer[rows] = np.maximum(
+            MIN_SPAWN_INTERVAL,
+            np.trunc(self.spawn_rate[rows] - frame * self.speed_growth[rows]).astype(np.int64),
+        )
+
+    def run(self, policy, max_frames=100_000):
+        """
+        Joue toutes les parties jusqu'à collision (ou max_frames).
+        policy(batch) -> tableau d'entrées de taille n. Renvoie (scores, frames).
+        """
+        for _ in range(max_frames):
+            if not self.alive.any():
+                break
+            self.step(policy(self))
+        return self.score.copy(), self.frame.copy()
+
+
+# ------------------------------ POLICIES -----------------------------
+def idle_policy(batch):
+    return INPUT_NONE
+
+
+def jump_policy(batch):
+    """Version vectorisée de runner_sim.jump_policy."""
+    dist = batch.ox - (PLAYER_X + PLAYER_W)
+    near = batch.active & (dist >= 0) & (dist < 40 + batch.speed[:, None] * 4)
+    return np.where(near.any(axis=1), INPUT_JUMP, INPUT_NONE)
+
+
+if __name__ == "__main__":
+    n = 10_000
+    batch = RunnerBatch(n, seed=1)
+    t0 = time.perf_counter()
+    scores, frames = batch.run(jump_policy, max_frames=20_000)
+    dt = time.perf_counter() - t0
+    print(f"{n} parties, {frames.sum() / dt:,.0f} ticks/s")
+    print(f"survie moyenne {frames.mean():.0f} frames, score moyen {scores.mean():.1f}, "
+          f"p50 {np.percentile(scores, 50):.0f}, p95 {np.percentile(scores, 95):.0f}")
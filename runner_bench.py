@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Cyber Runner Prime - Micro-benchmarks de la simulation
+# - broad phase : liste parcourue à chaque tick vs ScrollLane, à 10 / 100 / 1000 entités
+#
+#   python runner_bench.py [--ticks 2000]
+
+import argparse
+import random
+import time
+
+from runner_sim import GROUND_Y, WIDTH, Obstacle, Player, ScrollLane, overlap
+
+SPEED = 8.0
+
+
+# ---------------------------- BROAD PHASE ---------------------------
+class _NaiveObstacle:
+    """Obstacle tel qu'avant la broad phase : x déplacé et rect réalloué à chaque tick."""
+
+    def __init__(self, x, w, h):
+        self.x, self.w, self.h = x, w, h
+        self.y = GROUND_Y - h
+        self.rect = (x, self.y, w, h)
+        self.passed = False
+
+    def update(self, speed):
+        self.x -= speed
+        self.rect = (self.x, self.y, self.w, self.h)
+
+
+def _layout(n, rng):
+    """n obstacles répartis devant le joueur, espacés de façon régulière."""
+    spacing = max(20.0, 2 * WIDTH / n)
+    return spacing, [(WIDTH + i * spacing, rng.randint(40, 70), rng.randint(40, 100)) for i in range(n)]
+
+
+def bench_naive(n, ticks, seed=0):
+    rng = random.Random(seed)
+    spacing, layout = _layout(n, rng)
+    obstacles = [_NaiveObstacle(*spec) for spec in layout]
+    player = Player()
+    hits = passed = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        player.update()
+        culled = 0
+        for ob in obstacles[:]:
+            ob.update(SPEED)
+            if ob.x + ob.w < 0:
+                obstacles.remove(ob)
+                culled += 1
+            if overlap(ob.rect, player.rect):
+                hits += 1
+            if not ob.passed and ob.x + ob.w < player.x:
+                ob.passed = True
+                passed += 1
+        far = obstacles[-1].x
+        for _ in range(culled):
+            far += spacing
+            obstacles.append(_NaiveObstacle(far, rng.randint(40, 70), rng.randint(40, 100)))
+    return time.perf_counter() - t0, hits, passed
+
+
+def bench_lane(n, ticks, seed=0):
+    rng = random.Random(seed)
+    spacing, layout = _layout(n, rng)
+    lane = ScrollLane()
+    for spec in layout:
+        lane.add(Obstacle(*spec))
+    player = Player()
+    hits = passed = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        player.update()
+        lane.advance(SPEED)
+        before = len(lane)
+        lane.cull(0)
+        far = lane.keys[-1] - lane.scroll
+        for _ in range(before - len(lane)):
+            far += spacing
+            lane.add(Obstacle(far, rng.randint(40, 70), rng.randint(40, 100)))
+        for ob in lane.query(player.x, player.x + player.w):
+            if overlap(ob.rect, player.rect):
+                hits += 1
+        passed += len(lane.passed_by(player.x))
+    return time.perf_counter() - t0, hits, passed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmarks de la simulation Cyber Runner")
+    ap.add_argument("--ticks", type=int, default=2000)
+    args = ap.parse_args(argv)
+
+    print(f"broad phase, {args.ticks} ticks")
+    print(" entités | liste (µs/tick) | ScrollLane (µs/tick) | gain")
+    for n in (10, 100, 1000):
+        naive, *counts_naive = bench_naive(n, args.ticks)
+        lane, *counts_lane = bench_lane(n, args.ticks)
+        if counts_naive != counts_lane:
+            # les deux broad phases doivent voir les mêmes collisions et passages
+            raise SystemExit(f"{n} entités : liste {counts_naive} != ScrollLane {counts_lane} (collisions, passés)")
+        us = 1e6 / args.ticks
+        print(f" {n:7d} | {naive * us:15.1f} | {lane * us:20.1f} | x{naive / lane:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# Cyber Runner Prime - Bibliothèque de motifs d'obstacles vérifiés
+# - Génération hors ligne : énumération de motifs (1 à N obstacles, tailles et écarts)
+# - Chaque motif est vérifié par une recherche d'atteignabilité mémoïsée sur l'état
+#   du joueur (y, vy, on_ground, can_double, is_sliding, slide_timer), avec la vraie
+#   physique de Player et les règles d'entrée de RunnerSim.step (apply_inputs)
+# - Index binaire compact, par seau de vitesse ; au jeu, tirage O(1) dans le seau
+#
+# Garantie : joueur au sol à l'apparition du motif => il existe une suite d'entrées
+# qui le franchit et retombe au sol en `duration` frames. RunnerSim n'envoie pas le
+# motif suivant avant, ni tant qu'un obstacle n'est pas passé ou que le joueur est en
+# l'air (RunnerSim.ready_to_spawn, utile après un obstacle isolé de secours). Hors de
+# la plage de vitesses générée, ces obstacles isolés n'ont aucune garantie.
+# Vérifié à des vitesses espacées de SPEED_STEP dans le seau, obstacles élargis d'au
+# moins MARGIN px : couvre l'écart de position entre deux échantillons pendant toute
+# la durée du motif (SPEED_STEP / 2 * duration <= marge) et les imprécisions de
+# flottants. L'horizon de recherche (frame_limit) découle de la longueur du motif et
+# de la vitesse : aucun motif n'est écarté faute de frames.
+#
+# Exemples :
+#   python runner_patterns.py build                   # écrit cyber_runner_patterns.bin
+#   python runner_patterns.py build --max-obstacles 2 --speed-max 24
+#   python runner_patterns.py info                    # contenu de l'index
+
+import argparse
+import math
+import struct
+import sys
+import time
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import product
+
+from runner_sim import (
+    WIDTH, GROUND_Y, START_SPEED, DEFAULT_TUNING, INPUT_NONE, INPUT_JUMP, INPUT_SLIDE,
+    Player, Tuning, apply_inputs, overlap,
+)
+
+PATTERNS_FILE = "cyber_runner_patterns.bin"
+
+MARGIN = 10         # px ajoutés de chaque côté des obstacles pendant la vérification
+SPEED_STEP = 0.1    # écart entre deux vitesses vérifiées d'un même seau
+
+SPEED_MIN = START_SPEED
+SPEED_MAX = 32
+BUCKET_WIDTH = 1.0
+
+# grille d'énumération par défaut (tailles dans les bornes du spawn aléatoire)
+WIDTHS = (40, 70)
+HEIGHTS = (40, 70, 100)
+GAPS = (80, 160, 260)
+MAX_OBSTACLES = 3
+
+MAGIC = b"CRPT"
+VERSION = 1
+# magic, version, tuning (6 doubles), vitesse min, largeur de seau,
+# seaux, dispositions, obstacles, références
+# puis : dispositions, offsets (u32), références (u32), durées (u16)
+HEADER = struct.Struct("<4sB6dddHIII")
+LAYOUT = struct.Struct("<B")        # nombre d'obstacles
+OBSTACLE = struct.Struct("<HBB")    # dx, w, h
+
+
+@dataclass(frozen=True)
+class Pattern:
+    obstacles: tuple    # ((dx, w, h), ...) : dx depuis le bord gauche du premier obstacle
+    duration: int       # frames entre l'apparition et le retour au sol après le dernier
+
+
+# ---------------------------- VÉRIFICATION ---------------------------
+_air_frames = {}
+_transitions = {}   # tuning -> {(état, entrées): (état suivant, y hitbox, h hitbox)}
+_ground_states = {} # tuning -> [états au sol atteignables en 0, 1, 2... frames]
+
+
+def air_frames(tuning=DEFAULT_TUNING):
+    """Durée d'un saut complet depuis le sol, en frames."""
+    if tuning not in _air_frames:
+        player = Player(tuning)
+        apply_inputs(player, INPUT_JUMP)
+        n = 0
+        while True:
+            player.update()
+            n += 1
+            if player.on_ground:
+                break
+        _air_frames[tuning] = n
+    return _air_frames[tuning]
+
+
+def _step(player, transitions, state, inputs):
+    """Transition mémoïsée : (état suivant, y de la hitbox, h de la hitbox)."""
+    key = (state, inputs)
+    move = transitions.get(key)
+    if move is None:
+        player.set_state(state)
+        apply_inputs(player, inputs)
+        player.update()
+        after = player.get_state()
+        if not player.is_sliding:
+            # slide_timer n'est lu que pendant une glissade : états équivalents fusionnés
+            after = after[:-1] + (0,)
+        move = transitions[key] = (after, player.rect[1], player.rect[3])
+    return move
+
+
+def ground_states(frames, tuning=DEFAULT_TUNING):
+    """États au sol atteignables depuis l'arrêt en `frames` frames sans sauter (rien / glissade)."""
+    seq = _ground_states.get(tuning)
+    if seq is None:
+        player = Player(tuning)
+        transitions = _transitions.setdefault(tuning, {})
+        seq = [frozenset((player.get_state(),))]
+        while len(seq) < 2 or seq[-1] != seq[-2]:
+            seq.append(frozenset(_step(player, transitions, state, inputs)[0]
+                                 for state in seq[-1] for inputs in (INPUT_NONE, INPUT_SLIDE)))
+        _ground_states[tuning] = seq
+    return seq[min(frames, len(seq) - 1)]
+
+
+def frame_limit(obstacles, speed, tuning=DEFAULT_TUNING, margin=MARGIN):
+    """
+    Borne sur la durée d'un motif : le bord droit du dernier obstacle (élargi de
+    `margin`) dépasse le joueur avant ce délai même sans accélération, puis un saut
+    lancé à cet instant a le temps de retomber.
+    """
+    end = max(dx + w for dx, w, h in obstacles) + margin
+    return math.ceil((WIDTH + 20 + end - Player(tuning).x) / speed) + air_frames(tuning) + 2
+
+
+def verify(obstacles, speed, tuning=DEFAULT_TUNING, margin=MARGIN, max_frames=None):
+    """
+    Le motif apparaît (x = WIDTH + 20 + dx) quand la vitesse vaut `speed`, joueur au sol.
+    Renvoie la première frame où un état franchit tous les obstacles et touche le sol,
+    ou None si aucune suite d'entrées ne passe (horizon par défaut : frame_limit).
+
+    Parcours en largeur frame par frame ; les états identiques sont fusionnés (ensemble),
+    ce qui borne la recherche par le nombre d'états distincts du joueur et non par le
+    nombre de suites d'entrées. Les transitions (état, entrées) -> état ne dépendent ni
+    des obstacles ni de la vitesse : elles sont mémoïsées par tuning, d'un motif à l'autre.
+    Tant qu'aucun obstacle n'est à portée de saut, sauter est inutile (on retombe avant
+    lui) : seuls les états au sol sont gardés, et ces frames sont sautées d'un bloc.
+    """
+    if max_frames is None:
+        max_frames = frame_limit(obstacles, speed, tuning, margin)
+    player = Player(tuning)
+    transitions = _transitions.setdefault(tuning, {})
+    left, right = player.x, player.x + player.w
+    boxes = [[WIDTH + 20 + dx - margin, GROUND_Y - h, w + 2 * margin, h] for dx, w, h in obstacles]
+    starts = [b[0] for b in boxes]
+    reach_frames = air_frames(tuning) + 2
+
+    # avance rapide jusqu'à ce que le premier obstacle soit à portée de saut
+    first = min(starts)
+    scroll = 0.0
+    v = speed
+    skipped = 0
+    while skipped < max_frames:
+        v2 = v + tuning.speed_growth
+        if first - (scroll + v2) - right <= v2 * reach_frames:
+            break
+        v = v2
+        scroll += v
+        skipped += 1
+    frontier = ground_states(skipped, tuning)
+
+    for frame in range(skipped + 1, max_frames + 1):
+        # même ordre que RunnerSim.step : vitesse incrémentée après le spawn, puis advance
+        v += tuning.speed_growth
+        scroll += v
+        hits = []
+        ahead = None
+        for box, x0 in zip(boxes, starts):
+            box[0] = x = x0 - scroll
+            if x < right and x + box[2] > left:
+                hits.append(box)
+            elif x >= right and (ahead is None or x < ahead):
+                ahead = x
+        passed = not hits and ahead is None
+        window = ahead is not None and ahead - right <= v * reach_frames
+
+        nxt = set()
+        for state in frontier:
+            if not state[2]:
+                choices = (INPUT_NONE,)
+            elif window or hits:
+                choices = (INPUT_NONE, INPUT_JUMP, INPUT_SLIDE)
+            else:
+                choices = (INPUT_NONE, INPUT_SLIDE)
+            for inputs in choices:
+                after, y, h = _step(player, transitions, state, inputs)
+                if hits and any(overlap(box, (left, y, player.w, h)) for box in hits):
+                    continue
+                nxt.add(after)
+        if not nxt:
+            return None
+        if passed and any(state[2] for state in nxt):
+            return frame
+        frontier = nxt
+    return None
+
+
+def enumerate_patterns(widths=WIDTHS, heights=HEIGHTS, gaps=GAPS, max_obstacles=MAX_OBSTACLES):
+    """Tous les motifs de 1 à max_obstacles obstacles de la grille (tailles x écarts)."""
+    shapes = [(w, h) for w in widths for h in heights]
+    for n in range(1, max_obstacles + 1):
+        for combo in product(shapes, repeat=n):
+            for spacing in product(gaps, repeat=n - 1):
+                dx = 0
+                obstacles = []
+                for (w, h), gap in zip(combo, spacing + (0,)):
+                    obstacles.append((dx, w, h))
+                    dx += w + gap
+                yield tuple(obstacles)
+
+
+def verify_bucket(candidates, lo, width, tuning=DEFAULT_TUNING):
+    """Motifs franchissables à toutes les vitesses échantillonnées de [lo, lo + width]."""
+    steps = max(1, round(width / SPEED_STEP))
+    # la vitesse la plus basse d'abord : les sauts y sont les plus courts, les motifs
+    # serrés échouent là en premier
+    speeds = [lo + width * i / steps for i in range(steps + 1)]
+    out = []
+    for obstacles in candidates:
+        margin = MARGIN
+        while True:
+            duration = 0
+            for speed in speeds:
+                d = verify(obstacles, speed, tuning, margin)
+                if d is None:
+                    duration = None
+                    break
+                duration = max(duration, d)
+            # motif long : la marge doit couvrir l'écart entre échantillons sur toute sa durée
+            needed = math.ceil(SPEED_STEP / 2 * duration) if duration is not None else margin
+            if needed <= margin:
+                break
+            margin = needed
+        if duration is not None:
+            out.append(Pattern(obstacles, duration))
+    return out
+
+
+# ------------------------------- INDEX -------------------------------
+class PatternIndex:
+    """
+    Motifs vérifiés rangés par seau de vitesse. Chaque disposition d'obstacles n'est
+    stockée qu'une fois ; les entrées du seau b sont refs[offsets[b]:offsets[b + 1]]
+    (indice de disposition) et la durée, propre au seau, est dans durations.
+    """
+
+    def __init__(self, tuning, speed_min, bucket_width, layouts, offsets, refs, durations):
+        self.tuning = tuning
+        self.speed_min = speed_min
+        self.bucket_width = bucket_width
+        self.layouts = layouts
+        self.offsets = offsets
+        self.refs = refs
+        self.durations = durations
+        # une entrée prête à l'emploi par référence : pick() n'alloue rien
+        self.entries = [Pattern(layouts[r], d) for r, d in zip(refs, durations)]
+        self.checksum = zlib.crc32(self.encode())
+
+    @classmethod
+    def from_buckets(cls, tuning, speed_min, bucket_width, buckets):
+        """buckets : une liste de Pattern par seau."""
+        ids = {}
+        layouts = []
+        offsets = array("I", [0])
+        refs = array("I")
+        durations = array("H")
+        for bucket in buckets:
+            for p in bucket:
+                if p.obstacles not in ids:
+                    ids[p.obstacles] = len(layouts)
+                    layouts.append(p.obstacles)
+                refs.append(ids[p.obstacles])
+                durations.append(p.duration)
+            offsets.append(len(refs))
+        return cls(tuning, speed_min, bucket_width, layouts, offsets, refs, durations)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def bucket(self, speed):
+        """Indice du seau de `speed`, ou None hors de la plage générée."""
+        b = int((speed - self.speed_min) // self.bucket_width)
+        if 0 <= b < len(self):
+            return b
+        return None
+
+    def pick(self, speed, rng):
+        """Motif tiré au hasard dans le seau de `speed` (O(1)), ou None si le seau est vide."""
+        b = self.bucket(speed)
+        if b is None:
+            return None
+        lo = self.offsets[b]
+        n = self.offsets[b + 1] - lo
+        if not n:
+            return None
+        return self.entries[lo + rng.randrange(n)]
+
+    # ------------------------------ FORMAT ---------------------------
+    def encode(self):
+        t = self.tuning
+        n_obstacles = sum(len(layout) for layout in self.layouts)
+        parts = [HEADER.pack(MAGIC, VERSION,
+                             t.gravity, t.jump_force, t.double_jump_force, t.slide_time,
+                             t.spawn_rate, t.speed_growth,
+                             self.speed_min, self.bucket_width,
+                             len(self), len(self.layouts), n_obstacles, len(self.refs))]
+        for layout in self.layouts:
+            parts.append(LAYOUT.pack(len(layout)))
+            parts.extend(OBSTACLE.pack(*ob) for ob in layout)
+        parts.append(self.offsets.tobytes())
+        parts.append(self.refs.tobytes())
+        parts.append(self.durations.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data):
+        (magic, version, gravity, jump_force, double_jump_force, slide_time,
+         spawn_rate, speed_growth, speed_min, bucket_width,
+         n_buckets, n_layouts, n_obstacles, n_refs) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("ce fichier n'est pas une bibliothèque de motifs Cyber Runner")
+        if version != VERSION:
+            raise ValueError(f"version de bibliothèque non supportée: {version}")
+        tuning = Tuning(gravity=gravity, jump_force=jump_force,
+                        double_jump_force=double_jump_force, slide_time=int(slide_time),
+                        spawn_rate=spawn_rate, speed_growth=speed_growth)
+        pos = HEADER.size
+        layouts = []
+        for _ in range(n_layouts):
+            (n,) = LAYOUT.unpack_from(data, pos)
+            pos += LAYOUT.size
+            layouts.append(tuple(OBSTACLE.iter_unpack(data[pos:pos + n * OBSTACLE.size])))
+            pos += n * OBSTACLE.size
+        tables = []
+        for code, count in (("I", n_buckets + 1), ("I", n_refs), ("H", n_refs)):
+            table = array(code)
+            table.frombytes(data[pos:pos + count * table.itemsize])
+            pos += count * table.itemsize
+            tables.append(table)
+        return cls(tuning, speed_min, bucket_width, layouts, *tables)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+def load_patterns(path=PATTERNS_FILE, tuning=DEFAULT_TUNING):
+    """Index de `path` s'il existe et correspond à `tuning`, sinon None (spawn aléatoire)."""
+    try:
+        index = PatternIndex.load(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    return index if index.tuning == tuning else None
+
+
+# ----------------------------- GÉNÉRATION ----------------------------
+def build(tuning=DEFAULT_TUNING, speed_min=SPEED_MIN, speed_max=SPEED_MAX,
+          bucket_width=BUCKET_WIDTH, workers=None, **grid):
+    """Vérifie tous les motifs de la grille pour chaque seau (un seau par tâche)."""
+    candidates = list(enumerate_patterns(**grid))
+    n_buckets = max(1, round((speed_max - speed_min) / bucket_width))
+    buckets = [None] * n_buckets
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(verify_bucket, candidates, speed_min + b * bucket_width, bucket_width, tuning): b
+            for b in range(n_buckets)
+        }
+        for fut in as_completed(futures):
+            b = futures[fut]
+            buckets[b] = fut.result()
+            lo = speed_min + b * bucket_width
+            print(f"  vitesse {lo:5.1f}-{lo + bucket_width:<5.1f} : "
+                  f"{len(buckets[b]):5d} / {len(candidates)} motifs "
+                  f"({len(candidates) - len(buckets[b])} infranchissables)", file=sys.stderr, flush=True)
+    return PatternIndex.from_buckets(tuning, speed_min, bucket_width, buckets)
+
+
+def info(index):
+    size = len(index.encode())
+    print(f"{len(index.layouts)} dispositions, {len(index.refs)} motifs, "
+          f"{len(index)} seaux, {size} octets, crc32 {index.checksum:08x}")
+    for b in range(len(index)):
+        lo = index.speed_min + b * index.bucket_width
+        members = index.entries[index.offsets[b]:index.offsets[b + 1]]
+        by_size = {}
+        for p in members:
+            by_size[len(p.obstacles)] = by_size.get(len(p.obstacles), 0) + 1
+        durations = [p.duration for p in members]
+        print(f"  vitesse {lo:5.1f}+ : {len(members):5d} motifs "
+              f"({', '.join(f'{n} obst. x{c}' for n, c in sorted(by_size.items()))})"
+              + (f", durée {min(durations)}-{max(durations)} frames" if durations else ""))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bibliothèque de motifs d'obstacles vérifiés")
+    sub = ap.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("build", help="énumère, vérifie et écrit l'index")
+    b.add_argument("--out", default=PATTERNS_FILE)
+    b.add_argument("--speed-min", type=float, default=SPEED_MIN)
+    b.add_argument("--speed-max", type=float, default=SPEED_MAX)
+    b.add_argument("--bucket-width", type=float, default=BUCKET_WIDTH)
+    b.add_argument("--widths", default=",".join(map(str, WIDTHS)))
+    b.add_argument("--heights", default=",".join(map(str, HEIGHTS)))
+    b.add_argument("--gaps", default=",".join(map(str, GAPS)))
+    b.add_argument("--max-obstacles", type=int, default=MAX_OBSTACLES)
+    b.add_argument("--workers", type=int, default=None)
+    i = sub.add_parser("info", help="résumé d'un index")
+    i.add_argument("path", nargs="?", default=PATTERNS_FILE)
+    args = ap.parse_args(argv)
+
+    if args.command == "info":
+        info(PatternIndex.load(args.path))
+        return
+
+    ints = lambda s: tuple(int(x) for x in s.split(","))
+    t0 = time.perf_counter()
+    index = build(speed_min=args.speed_min, speed_max=args.speed_max,
+                  bucket_width=args.bucket_width, workers=args.workers,
+                  widths=ints(args.widths), heights=ints(args.heights),
+                  gaps=ints(args.gaps), max_obstacles=args.max_obstacles)
+    index.save(args.out)
+    print(f"{args.out} écrit en {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+    info(index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# Cyber Runner Prime - Profilage du temps de frame
+# - Chronométrage par phase avec perf_counter_ns (events, update_play, particles, ...)
+# - Percentiles glissants p50 / p95 / p99 sur les N dernières frames
+# - Overlay en jeu (F3) et export des traces en CSV / JSON (F4)
+# - Allocations par frame (objets suivis par le GC, net) et pauses du GC
+# - Désactivé, le coût se limite à un test `if prof` par phase dans Game.run
+
+import csv
+import gc
+import json
+from collections import deque
+from time import perf_counter_ns
+
+PHASES = (
+    "events", "update_play", "particles", "draw_background",
+    "draw_entities", "text", "overlay", "flip",
+)
+# "gc" : temps passé dans le GC pendant la frame (déjà inclus dans les phases)
+COLUMNS = PHASES + ("gc", "frame")
+COUNTERS = ("allocs",)
+OVERLAY_REFRESH = 30  # frames entre deux recalculs de l'overlay
+
+
+class AllocationCounter:
+    """
+    Allocations nettes d'objets suivis par le GC (conteneurs) et temps de pause du GC.
+    Le compteur de génération 0 (gc.get_count) augmente à chaque allocation et
+    diminue à chaque libération ; il est remis à zéro par une collecte, d'où le
+    report via gc.callbacks.
+    """
+
+    def __init__(self):
+        self.pause_ns = 0
+        self.collections = 0
+        self._base = 0
+        self._carry = 0
+        self._t = 0
+
+    def install(self):
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def uninstall(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._t = perf_counter_ns()
+            self._carry += gc.get_count()[0] - self._base
+        else:
+            self.pause_ns += perf_counter_ns() - self._t
+            self.collections += 1
+            self._base = gc.get_count()[0]
+
+    def begin(self):
+        self.pause_ns = 0
+        self._carry = 0
+        self._base = gc.get_count()[0]
+
+    def net(self):
+        return self._carry + gc.get_count()[0] - self._base
+
+
+class FrameProfiler:
+    def __init__(self, window=600, max_trace=100_000):
+        self.window = window
+        self.samples = {c: deque(maxlen=window) for c in COLUMNS + COUNTERS}
+        self.trace = deque(maxlen=max_trace)
+        self.frames = 0
+        self.show = False
+        self.allocs = AllocationCounter()
+        self.allocs.install()
+
+        self._t0 = self._last = 0
+        self._row = dict.fromkeys(COLUMNS + COUNTERS, 0)
+        self._lines = []
+
+    # ---------------------------- MESURE -----------------------------
+    def start(self):
+        self._t0 = self._last = perf_counter_ns()
+        row = self._row
+        for c in COLUMNS:
+            row[c] = 0
+        self.allocs.begin()
+
+    def lap(self, phase):
+        """Attribue le temps écoulé depuis le dernier lap à `phase`."""
+        now = perf_counter_ns()
+        self._row[phase] += now - self._last
+        self._last = now
+
+    def end(self):
+        row = self._row
+        row["frame"] = self._last - self._t0
+        row["gc"] = self.allocs.pause_ns
+        row["allocs"] = self.allocs.net()
+        values = tuple(row[c] for c in COLUMNS + COUNTERS)
+        for c, v in zip(COLUMNS + COUNTERS, values):
+            self.samples[c].append(v)
+        self.trace.append(values)
+        self.frames += 1
+
+    # ---------------------------- STATS ------------------------------
+    def percentiles(self, column, qs=(50, 95, 99)):
+        """Percentiles (rang le plus proche) sur la fenêtre glissante (ns, ou nombre pour COUNTERS)."""
+        data = sorted(self.samples[column])
+        if not data:
+            return [0] * len(qs)
+        n = len(data)
+        return [data[min(n - 1, max(0, -(-q * n // 100) - 1))] for q in qs]
+
+    def summary(self):
+        out = {}
+        for c in COLUMNS:
+            p50, p95, p99 = self.percentiles(c)
+            data = self.samples[c]
+            out[c] = {
+                "p50_us": p50 / 1000, "p95_us": p95 / 1000, "p99_us": p99 / 1000,
+                "mean_us": sum(data) / len(data) / 1000 if data else 0.0,
+            }
+        for c in COUNTERS:
+            p50, p95, p99 = self.percentiles(c)
+            data = self.samples[c]
+            out[c] = {
+                "p50": p50, "p95": p95, "p99": p99,
+                "mean": sum(data) / len(data) if data else 0.0,
+            }
+        return out
+
+    # ---------------------------- EXPORT -----------------------------
+    def export_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(("frame_index",) + tuple(f"{c}_ns" for c in COLUMNS) + COUNTERS)
+            first = self.frames - len(self.trace)
+            for i, row in enumerate(self.trace, first):
+                w.writerow((i,) + row)
+
+    def export_json(self, path):
+        first = self.frames - len(self.trace)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "columns_ns": list(COLUMNS),
+                "counters": list(COUNTERS),
+                "first_frame": first,
+                "summary": self.summary(),
+                "frames": [list(row) for row in self.trace],
+            }, f)
+
+    # ---------------------------- OVERLAY ----------------------------
+    def draw(self, surf, font, pos=(10, 40)):
+        if self.frames % OVERLAY_REFRESH == 0 or not self._lines:
+            lines = [f"{'phase':<16}{'p50':>8}{'p95':>8}{'p99':>8}  µs"]
+            for c in COLUMNS:
+                p50, p95, p99 = self.percentiles(c)
+                lines.append(f"{c:<16}{p50 / 1000:8.0f}{p95 / 1000:8.0f}{p99 / 1000:8.0f}")
+            p50, p95, p99 = self.percentiles("allocs")
+            lines.append(f"{'allocs/frame':<16}{p50:8d}{p95:8d}{p99:8d}")
+            self._lines = [font.render(t, True, (255, 230, 120)) for t in lines]
+        x, y = pos
+        surf.blits([(s, (x, y + i * s.get_height())) for i, s in enumerate(self._lines)], False)
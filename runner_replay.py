@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Cyber Runner Prime - Enregistrement et rejeu déterministes
+# - Une partie = seed + Tuning + bibliothèque de motifs (crc32, 0 = aucune)
+#   + un masque d'entrées par frame
+# - Format binaire compact, entrées encodées en RLE (masque, longueur)
+# - Rejeu headless à vitesse maximale, validé par le score et le nombre de frames
+# - Rejeu affiché (pygame) à un multiplicateur de vitesse choisi
+#
+# Exemples :
+#   python runner_replay.py cyber_runner_last.replay            # vérification headless
+#   python runner_replay.py cyber_runner_last.replay --play 4   # affichage x4
+
+import argparse
+import struct
+import sys
+import time
+
+from runner_patterns import PATTERNS_FILE, PatternIndex
+from runner_sim import RunnerSim, Tuning
+
+MAGIC = b"CRRP"
+VERSION = 2
+PREFIX = struct.Struct("<4sB")
+# magic, version, seed, tuning (6 doubles), [v2 : crc32 des motifs], frames, score, nombre de runs RLE
+HEADERS = {
+    1: struct.Struct("<4sBQ6dIII"),
+    2: struct.Struct("<4sBQ6dIIII"),
+}
+HEADER = HEADERS[VERSION]
+RUN = struct.Struct("<BH")
+MAX_RUN = 0xFFFF
+
+
+class ReplayMismatch(ValueError):
+    """Le rejeu ne reproduit pas le score / nombre de frames enregistrés."""
+
+
+# ------------------------------ FORMAT -------------------------------
+def rle_encode(inputs):
+    """Séquence de masques -> liste de (masque, longueur), longueur <= MAX_RUN."""
+    runs = []
+    prev, length = None, 0
+    for mask in inputs:
+        if mask == prev and length < MAX_RUN:
+            length += 1
+        else:
+            if length:
+                runs.append((prev, length))
+            prev, length = mask, 1
+    if length:
+        runs.append((prev, length))
+    return runs
+
+
+def rle_decode(runs):
+    out = bytearray()
+    for mask, length in runs:
+        out += bytes((mask,)) * length
+    return bytes(out)
+
+
+class Replay:
+    def __init__(self, seed, tuning, inputs, score, frames, patterns=0):
+        self.seed = seed
+        self.tuning = tuning
+        self.inputs = bytes(inputs)
+        self.score = score
+        self.frames = frames
+        self.patterns = patterns    # PatternIndex.checksum, 0 = spawn aléatoire
+
+    def __repr__(self):
+        return f"Replay(seed={self.seed}, frames={self.frames}, score={self.score})"
+
+    def encode(self):
+        t = self.tuning
+        runs = rle_encode(self.inputs)
+        parts = [HEADER.pack(MAGIC, VERSION, self.seed,
+                             t.gravity, t.jump_force, t.double_jump_force, t.slide_time,
+                             t.spawn_rate, t.speed_growth, self.patterns,
+                             self.frames, self.score, len(runs))]
+        parts.extend(RUN.pack(mask, length) for mask, length in runs)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data):
+        magic, version = PREFIX.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("ce fichier n'est pas un replay Cyber Runner")
+        if version not in HEADERS:
+            raise ValueError(f"version de replay non supportée: {version}")
+        header = HEADERS[version]
+        fields = header.unpack_from(data)
+        if version == 1:
+            fields = fields[:9] + (0,) + fields[9:]
+        (_, _, seed, gravity, jump_force, double_jump_force, slide_time,
+         spawn_rate, speed_growth, patterns, frames, score, nruns) = fields
+        runs = RUN.iter_unpack(data[header.size:header.size + nruns * RUN.size])
+        tuning = Tuning(gravity=gravity, jump_force=jump_force,
+                        double_jump_force=double_jump_force, slide_time=int(slide_time),
+                        spawn_rate=spawn_rate, speed_growth=speed_growth)
+        return cls(seed, tuning, rle_decode(runs), score, frames, patterns)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+class Recorder:
+    """Accumule un masque d'entrées par frame pendant une partie."""
+
+    def __init__(self, seed, tuning, patterns=None):
+        self.seed = seed
+        self.tuning = tuning
+        self.patterns = patterns.checksum if patterns is not None else 0
+        self.inputs = bytearray()
+
+    def record(self, mask):
+        self.inputs.append(mask)
+
+    def finish(self, sim):
+        return Replay(self.seed, self.tuning, self.inputs, sim.score, sim.frame, self.patterns)
+
+
+# ------------------------------ REPLAY -------------------------------
+def replay_patterns(replay, path=PATTERNS_FILE):
+    """Bibliothèque de motifs utilisée par la partie (None si spawn aléatoire)."""
+    if not replay.patterns:
+        return None
+    try:
+        index = PatternIndex.load(path)
+    except (OSError, ValueError, struct.error):
+        index = None
+    if index is None or index.checksum != replay.patterns:
+        raise ReplayMismatch(
+            f"bibliothèque de motifs {replay.patterns:08x} introuvable ({path})")
+    return index
+
+
+def simulate(replay, patterns=None):
+    """Re-simule la partie sans affichage, à vitesse maximale."""
+    if patterns is None:
+        patterns = replay_patterns(replay)
+    sim = RunnerSim(seed=replay.seed, tuning=replay.tuning, patterns=patterns)
+    step = sim.step
+    for mask in replay.inputs:
+        step(mask)
+    return sim
+
+
+def verify(replay, patterns=None):
+    """Rejoue et lève ReplayMismatch si le score ou le nombre de frames diffère."""
+    sim = simulate(replay, patterns)
+    if (sim.score, sim.frame) != (replay.score, replay.frames):
+        raise ReplayMismatch(
+            f"replay divergent: score {sim.score} (attendu {replay.score}), "
+            f"frames {sim.frame} (attendu {replay.frames})"
+        )
+    return sim
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Rejeu de parties Cyber Runner")
+    ap.add_argument("fichier")
+    ap.add_argument("--play", type=float, metavar="VITESSE",
+                    help="affiche le rejeu avec pygame à ce multiplicateur de vitesse")
+    args = ap.parse_args(argv)
+
+    replay = Replay.load(args.fichier)
+    if args.play:
+        from game import ReplayGame
+        ReplayGame(replay, speed=args.play).run()
+        return
+
+    t0 = time.perf_counter()
+    try:
+        verify(replay)
+    except ReplayMismatch as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    dt = time.perf_counter() - t0
+    print(f"{replay!r} OK en {dt * 1000:.1f} ms ({replay.frames / max(dt, 1e-9):,.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
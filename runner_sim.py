@@ -0,0 +1,419 @@
+# Cyber Runner Prime - Cœur de simulation headless
+# - Aucune dépendance à pygame : tourne sans écran, sur un serveur, dans un bot
+# - Pas de temps fixe : un appel à step() = une frame du jeu (60 FPS)
+# - Entrées sous forme de masque de bits par tick (INPUT_JUMP | INPUT_SLIDE)
+# - game.py n'est plus qu'un moteur de rendu au-dessus de RunnerSim
+
+import random
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+# ----------------------------- CONSTANTS ----------------------------
+WIDTH, HEIGHT = 900, 540
+GROUND_Y = HEIGHT - 90
+GRAVITY = 1.05
+
+# Player tuning
+JUMP_FORCE = -17
+DOUBLE_JUMP_FORCE = -14
+dash_speed = 14
+SLIDE_TIME = 25
+
+# Level tuning
+SPAWN_RATE = 95
+POWERUP_RATE = 0.1
+SPEED_GROWTH = 0.004
+START_SPEED = 8
+MIN_SPAWN_INTERVAL = 40
+PASS_SCORE = 15
+
+
+@dataclass(frozen=True)
+class Tuning:
+    """
+    Constantes de tuning d'une partie. Passées explicitement à Player / RunnerSim
+    pour pouvoir simuler plusieurs configurations dans le même processus.
+    """
+    gravity: float = GRAVITY
+    jump_force: float = JUMP_FORCE
+    double_jump_force: float = DOUBLE_JUMP_FORCE
+    slide_time: int = SLIDE_TIME
+    spawn_rate: float = SPAWN_RATE
+    speed_growth: float = SPEED_GROWTH
+
+
+DEFAULT_TUNING = Tuning()
+
+# Inputs (bitmask par tick)
+INPUT_NONE = 0
+INPUT_JUMP = 1
+INPUT_SLIDE = 2
+
+# Events renvoyés par RunnerSim.step
+EVENT_NONE = 0
+EVENT_CRASH = 1
+EVENT_PASS = 2
+EVENT_SPAWN = 4
+EVENT_JUMP = 8
+
+# ---------------------------- UTILITIES -----------------------------
+def overlap(a, b):
+    """Test AABB strict entre deux boîtes (x, y, w, h), comme Rect.colliderect."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def apply_inputs(player, inputs):
+    """Applique le masque d'entrées d'un tick au joueur (avant update) ; renvoie les EVENT_*."""
+    events = EVENT_NONE
+    if inputs & INPUT_JUMP and player.on_ground:
+        player.jump()
+        events |= EVENT_JUMP
+    if inputs & INPUT_SLIDE:
+        player.slide()
+    return events
+
+# ------------------------------ PLAYER ------------------------------
+class Player:
+    __slots__ = ("tuning", "x", "y", "w", "h", "vy", "on_ground", "can_double",
+                 "is_sliding", "slide_timer", "rect")
+
+    def __init__(self, tuning=DEFAULT_TUNING):
+        self.tuning = tuning
+        self.x = 150
+        self.y = GROUND_Y - 64
+        self.w = 48
+        self.h = 64
+
+        self.vy = 0
+        self.on_ground = True
+        self.can_double = True
+        self.is_sliding = False
+        self.slide_timer = 0
+
+        self.rect = [self.x, self.y, self.w, self.h]
+
+    # état dynamique complet (la hitbox s'en déduit à update)
+    def get_state(self):
+        return (self.y, self.vy, self.on_ground, self.can_double, self.is_sliding, self.slide_timer)
+
+    def set_state(self, state):
+        (self.y, self.vy, self.on_ground, self.can_double,
+         self.is_sliding, self.slide_timer) = state
+
+    def jump(self):
+        if self.on_ground:
+            self.vy = self.tuning.jump_force
+            self.on_ground = False
+            self.can_double = True
+        elif self.can_double:
+            self.vy = self.tuning.double_jump_force
+            self.can_double = False
+
+    def slide(self):
+        if self.on_ground and not self.is_sliding:
+            self.is_sliding = True
+            self.slide_timer = self.tuning.slide_time
+
+    def update(self):
+        self.vy += self.tuning.gravity
+        self.y += self.vy
+
+        if self.y + self.h >= GROUND_Y:
+            self.y = GROUND_Y - self.h
+            self.vy = 0
+            self.on_ground = True
+            self.is_sliding = False
+
+        if self.is_sliding:
+            self.slide_timer -= 1
+            if self.slide_timer <= 0:
+                self.is_sliding = False
+
+        # update hitbox (en place)
+        rect = self.rect
+        if self.is_sliding:
+            rect[1] = self.y + self.h//2
+            rect[3] = self.h//2
+        else:
+            rect[1] = self.y
+            rect[3] = self.h
+
+# ------------------------------ OBSTACLES ----------------------------
+class Obstacle:
+    __slots__ = ("w", "h", "x", "wx", "y", "rect", "passed")
+
+    def __init__(self, x, w, h):
+        self.rect = [0, 0, 0, 0]
+        self.reset(x, w, h)
+
+    def reset(self, x, w, h):
+        """(Ré)initialise l'obstacle en place : la hitbox est réutilisée."""
+        self.w = w
+        self.h = h
+        self.x = x
+        self.wx = x     # position "monde", fixée par ScrollLane.add
+        self.y = GROUND_Y - h
+        rect = self.rect
+        rect[0] = x
+        rect[1] = self.y
+        rect[2] = w
+        rect[3] = h
+        self.passed = False
+
+    def place(self, x):
+        self.x = x
+        self.rect[0] = x
+
+
+class ObstaclePool:
+    """Free-list d'obstacles : plus d'allocation au spawn une fois la partie lancée."""
+
+    def __init__(self):
+        self.free = []
+        self.created = 0
+
+    def acquire(self, x, w, h):
+        if self.free:
+            ob = self.free.pop()
+            ob.reset(x, w, h)
+            return ob
+        self.created += 1
+        return Obstacle(x, w, h)
+
+    def release(self, ob):
+        self.free.append(ob)
+
+# ---------------------------- BROAD PHASE ---------------------------
+class ScrollLane:
+    """
+    Broad phase pour les entités qui défilent toutes à la même vitesse
+    (obstacles, bonus...). Chaque entité garde sa position monde wx = x + scroll,
+    triée : faire défiler la voie est O(1) et une requête sur un intervalle
+    d'écran est O(log n + k). Le x d'écran n'est recalculé (place) que pour
+    les entités renvoyées ou parcourues.
+    """
+
+    COMPACT_AT = 64
+
+    def __init__(self):
+        self.items = []
+        self.keys = []      # wx des entités, pour bisect
+        self.head = 0       # les entités avant head sont sorties de l'écran
+        self.cursor = 0     # les entités avant cursor sont toutes "passées"
+        self.scroll = 0.0
+        self.max_w = 0
+
+    def __len__(self):
+        return len(self.items) - self.head
+
+    def __iter__(self):
+        scroll = self.scroll
+        items = self.items
+        for i in range(self.head, len(items)):
+            ent = items[i]
+            ent.place(ent.wx - scroll)
+            yield ent
+
+    def add(self, ent):
+        ent.wx = wx = ent.x + self.scroll
+        if ent.w > self.max_w:
+            self.max_w = ent.w
+        if not self.keys or wx >= self.keys[-1]:
+            self.items.append(ent)
+            self.keys.append(wx)
+        else:
+            i = bisect_right(self.keys, wx, self.head)
+            self.items.insert(i, ent)
+            self.keys.insert(i, wx)
+            self.cursor = min(self.cursor, i)
+
+    def advance(self, dx):
+        self.scroll += dx
+
+    def query(self, x0, x1):
+        """Entités dont l'intervalle [x, x + w] d'écran chevauche ]x0, x1[."""
+        s = self.scroll
+        lo = bisect_right(self.keys, x0 + s - self.max_w, self.head)
+        hi = bisect_left(self.keys, x1 + s, lo)
+        out = []
+        for i in range(lo, hi):
+            ent = self.items[i]
+            x = ent.wx - s
+            if x + ent.w > x0:
+                ent.place(x)
+                out.append(ent)
+        return out
+
+    def passed_by(self, x):
+        """Entités dont le bord droit vient de passer à gauche de x (une seule fois)."""
+        s = self.scroll
+        items = self.items
+        hi = bisect_left(self.keys, x + s, self.cursor)
+        out = []
+        for i in range(self.cursor, hi):
+            ent = items[i]
+            if not ent.passed and ent.wx + ent.w - s < x:
+                ent.passed = True
+                out.append(ent)
+        while self.cursor < len(items) and items[self.cursor].passed:
+            self.cursor += 1
+        return out
+
+    def all_passed(self):
+        """Vrai quand passed_by a déjà renvoyé toutes les entités de la voie."""
+        return self.cursor >= len(self.items)
+
+    def cull(self, x_min=0, release=None):
+        """
+        Retire les entités de tête sorties de l'écran (x + w < x_min).
+        release(ent) est appelé pour chacune (retour dans un pool).
+        """
+        s = self.scroll
+        items = self.items
+        head = self.head
+        while head < len(items) and items[head].wx + items[head].w - s < x_min:
+            if release is not None:
+                release(items[head])
+            head += 1
+        self.head = head
+        self.cursor = max(self.cursor, head)
+        if head >= self.COMPACT_AT and head * 2 >= len(items):
+            del items[:head]
+            del self.keys[:head]
+            self.cursor -= head
+            self.head = 0
+
+# ---------------------------- SIMULATION ----------------------------
+class RunnerSim:
+    """
+    Simulation pure d'une partie : joueur, obstacles, minuterie d'apparition,
+    accélération, score et collisions. step(inputs) avance d'une frame et
+    renvoie un masque d'EVENT_*.
+    """
+
+    def __init__(self, seed=None, tuning=DEFAULT_TUNING, pool=None, patterns=None):
+        self.seed = seed
+        self.tuning = tuning
+        # pool partageable entre simulations successives (Game.reset)
+        self.pool = pool if pool is not None else ObstaclePool()
+        # runner_patterns.PatternIndex : motifs vérifiés par vitesse (None = un obstacle au hasard)
+        if patterns is not None and patterns.tuning != tuning:
+            raise ValueError("bibliothèque de motifs générée pour un autre tuning")
+        self.patterns = patterns
+        self.obstacles = None
+        self.reset()
+
+    def reset(self):
+        self.recycle()
+        self.rng = random.Random(self.seed)
+        self.player = Player(self.tuning)
+        self.obstacles = ScrollLane()
+        self.speed = START_SPEED
+        self.timer = self.tuning.spawn_rate
+        self.score = 0
+        self.frame = 0
+        self.over = False
+
+    def recycle(self):
+        """Rend au pool les obstacles encore en jeu."""
+        if self.obstacles is not None:
+            for ob in self.obstacles:
+                self.pool.release(ob)
+            self.obstacles = ScrollLane()
+
+    # ----------------------------- SPAWN -----------------------------
+    def spawn_obstacle(self):
+        """Fait apparaître un obstacle ou un motif ; renvoie le délai minimal avant le suivant."""
+        if self.patterns is not None:
+            pattern = self.patterns.pick(self.speed, self.rng)
+            if pattern is not None:
+                for dx, w, h in pattern.obstacles:
+                    self.obstacles.add(self.pool.acquire(WIDTH + 20 + dx, w, h))
+                return pattern.duration
+        w = self.rng.randint(40, 70)
+        h = self.rng.randint(40, 100)
+        self.obstacles.add(self.pool.acquire(WIDTH + 20, w, h))
+        return 0
+
+    def ready_to_spawn(self):
+        """
+        Un motif n'est vérifié que depuis le sol, piste vide. Dans la plage de la
+        bibliothèque, on attend donc que le joueur ait passé tous les obstacles
+        (un obstacle isolé de secours, par exemple) et soit au sol.
+        """
+        patterns = self.patterns
+        if patterns is None or patterns.bucket(self.speed) is None:
+            return True
+        return self.player.on_ground and self.obstacles.all_passed()
+
+    # ----------------------------- STEP ------------------------------
+    def step(self, inputs=INPUT_NONE):
+        player = self.player
+        events = apply_inputs(player, inputs)
+        player.update()
+
+        lane = self.obstacles
+        lane.advance(self.speed)
+        lane.cull(0, self.pool.release)
+
+        # broad phase : seuls les obstacles qui chevauchent le joueur en x
+        for ob in lane.query(player.x, player.x + player.w):
+            if overlap(ob.rect, player.rect):
+                self.over = True
+                events |= EVENT_CRASH
+
+        passed = lane.passed_by(player.x)
+        if passed:
+            self.score += PASS_SCORE * len(passed)
+            events |= EVENT_PASS
+
+        # spawn logic
+        self.timer -= 1
+        if self.timer <= 0 and self.ready_to_spawn():
+            # un motif occupe la piste jusqu'à ce que le joueur ait pu le franchir
+            busy = self.spawn_obstacle()
+            t = self.tuning
+            self.timer = max(MIN_SPAWN_INTERVAL, int(t.spawn_rate - self.frame * t.speed_growth), busy)
+            events |= EVENT_SPAWN
+
+        self.frame += 1
+        self.speed += self.tuning.speed_growth
+        return events
+
+    def run(self, policy, max_frames=100_000):
+        """
+        Joue jusqu'à la collision (ou max_frames). policy(sim) -> masque d'entrées.
+        Renvoie (score, frames).
+        """
+        while not self.over and self.frame < max_frames:
+            self.step(policy(self))
+        return self.score, self.frame
+
+
+# ------------------------------ POLICIES -----------------------------
+def idle_policy(sim):
+    return INPUT_NONE
+
+
+def jump_policy(sim):
+    """Bot naïf : saute dès qu'un obstacle arrive à portée."""
+    px = sim.player.x + sim.player.w
+    for ob in sim.obstacles.query(px, px + 40 + sim.speed * 4):
+        if ob.x >= px:
+            return INPUT_JUMP
+    return INPUT_NONE
+
+
+if __name__ == "__main__":
+    sim = RunnerSim(seed=1)
+    ticks = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < 1.0:
+        sim.reset()
+        sim.run(jump_policy)
+        ticks += sim.frame
+    dt = time.perf_counter() - t0
+    print(f"{ticks / dt:,.0f} ticks/s (dernier score {sim.score}, {sim.frame} frames)")
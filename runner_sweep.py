@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# Cyber Runner Prime - Balayage de difficulté multi-cœurs
+# - Grille de configurations sur SPAWN_RATE, SPEED_GROWTH, JUMP_FORCE, GRAVITY
+# - Parties headless et seedées réparties sur un ProcessPoolExecutor
+# - Résultats affichés au fil de l'eau (dès qu'une configuration est terminée)
+#
+# Exemple :
+#   python runner_sweep.py --spawn-rate 80:110:10 --speed-growth 0.003,0.004 --runs 2000
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import runner_sim
+from runner_sim import DEFAULT_TUNING, RunnerSim, Tuning
+
+TICKS_PER_SECOND = 60
+POLICIES = {
+    "idle": "idle_policy",
+    "jump": "jump_policy",
+}
+SWEPT = ("spawn_rate", "speed_growth", "jump_force", "gravity")
+
+
+# ---------------------------- UTILITIES -----------------------------
+def parse_range(text):
+    """'a:b:pas' (bornes incluses), 'a,b,c' ou une valeur seule -> liste de floats."""
+    if ":" in text:
+        start, stop, step = (float(v) for v in text.split(":"))
+        if step == 0:
+            raise argparse.ArgumentTypeError(f"pas nul dans {text!r}")
+        count = int(round((stop - start) / step)) + 1
+        if count <= 0:
+            raise argparse.ArgumentTypeError(f"intervalle vide: {text!r}")
+        return [round(start + i * step, 10) for i in range(count)]
+    return [float(v) for v in text.split(",")]
+
+
+def describe(values):
+    a = np.asarray(values, dtype=np.float64)
+    p50, p95, p99 = np.percentile(a, (50, 95, 99))
+    return {
+        "mean": float(a.mean()), "std": float(a.std()),
+        "min": float(a.min()), "p50": float(p50), "p95": float(p95), "p99": float(p99),
+        "max": float(a.max()),
+    }
+
+
+# ------------------------------ WORKERS ------------------------------
+def run_chunk(tuning, seeds, policy="jump", max_frames=20_000, engine="sim"):
+    """Joue une tranche de parties (exécuté dans un processus du pool)."""
+    if engine == "batch":
+        import runner_batch
+        batch = runner_batch.RunnerBatch.from_tuning(len(seeds), tuning, seed=seeds[0])
+        scores, frames = batch.run(getattr(runner_batch, POLICIES[policy]), max_frames)
+        return scores.tolist(), frames.tolist()
+
+    policy_fn = getattr(runner_sim, POLICIES[policy])
+    scores, frames = [], []
+    for seed in seeds:
+        score, frame = RunnerSim(seed=seed, tuning=tuning).run(policy_fn, max_frames)
+        scores.append(score)
+        frames.append(frame)
+    return scores, frames
+
+
+def sweep(tunings, runs, workers=None, chunk=None, base_seed=0, policy="jump",
+          max_frames=20_000, engine="sim"):
+    """
+    Générateur : produit (tuning, stats) dès qu'une configuration est terminée.
+    Les mêmes seeds sont utilisées pour toutes les configurations.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk = chunk or max(1, runs // (workers * 4))
+    seeds = list(range(base_seed, base_seed + runs))
+    slices = [seeds[i:i + chunk] for i in range(0, runs, chunk)]
+
+    pending = {}
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for idx, tuning in enumerate(tunings):
+            pending[idx] = len(slices)
+            results[idx] = ([], [])
+            for part in slices:
+                fut = pool.submit(run_chunk, tuning, part, policy, max_frames, engine)
+                futures[fut] = idx
+        for fut in as_completed(futures):
+            idx = futures[fut]
+            scores, frames = fut.result()
+            results[idx][0].extend(scores)
+            results[idx][1].extend(frames)
+            pending[idx] -= 1
+            if pending[idx] == 0:
+                scores, frames = results.pop(idx)
+                yield tunings[idx], {
+                    "runs": len(scores),
+                    "score": describe(scores),
+                    "survival_s": describe(np.asarray(frames) / TICKS_PER_SECOND),
+                }
+
+
+# -------------------------------- CLI --------------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Balayage de difficulté Cyber Runner (multi-cœurs)")
+    ap.add_argument("--spawn-rate", type=parse_range, default=[DEFAULT_TUNING.spawn_rate])
+    ap.add_argument("--speed-growth", type=parse_range, default=[DEFAULT_TUNING.speed_growth])
+    ap.add_argument("--jump-force", type=parse_range, default=[DEFAULT_TUNING.jump_force])
+    ap.add_argument("--gravity", type=parse_range, default=[DEFAULT_TUNING.gravity])
+    ap.add_argument("--runs", type=int, default=1000, help="parties par configuration")
+    ap.add_argument("--seed", type=int, default=0, help="première seed")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--chunk", type=int, default=None, help="parties par tâche")
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="jump")
+    ap.add_argument("--max-frames", type=int, default=20_000)
+    ap.add_argument("--engine", choices=("sim", "batch"), default="sim",
+                    help="sim = RunnerSim par partie, batch = RunnerBatch NumPy par tâche")
+    ap.add_argument("--json", metavar="FICHIER", help="écrit aussi les résultats en JSON")
+    args = ap.parse_args(argv)
+
+    grid = itertools.product(args.spawn_rate, args.speed_growth, args.jump_force, args.gravity)
+    tunings = [
+        Tuning(spawn_rate=sr, speed_growth=sg, jump_force=jf, gravity=g)
+        for sr, sg, jf, g in grid
+    ]
+
+    print(f"{len(tunings)} configurations x {args.runs} parties", file=sys.stderr)
+    print("spawn_rate  speed_growth  jump_force  gravity | survie p50/p95 (s) | score moy  p50  p95")
+    rows = []
+    t0 = time.perf_counter()
+    for tuning, stats in sweep(tunings, args.runs, args.workers, args.chunk, args.seed,
+                               args.policy, args.max_frames, args.engine):
+        sv, sc = stats["survival_s"], stats["score"]
+        print(f"{tuning.spawn_rate:10g}  {tuning.speed_growth:12g}  {tuning.jump_force:10g}  "
+              f"{tuning.gravity:7g} | {sv['p50']:7.1f} / {sv['p95']:7.1f}   | "
+              f"{sc['mean']:9.1f} {sc['p50']:4.0f} {sc['p95']:4.0f}", flush=True)
+        rows.append({**{k: getattr(tuning, k) for k in SWEPT}, **stats})
+    print(f"terminé en {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
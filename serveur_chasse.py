@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chasse au Trésor - Serveur multi-sessions (asyncio)
+- Des milliers de parties ModeleJeu simultanées dans un seul processus
+- Protocole ligne : un objet JSON par ligne, dans chaque sens, sur TCP
+- Sessions inactives expirées, échéances du mode Chrono tenues par une seule
+  roue temporelle (pas de boucle de polling par partie)
+- Client de charge : requêtes/s et percentiles de latence
+
+  python serveur_chasse.py serveur [--port 8765]
+  python serveur_chasse.py charge [--clients 200 --parties 20]
+
+Requêtes (champ "id" facultatif, renvoyé tel quel dans la réponse) :
+  {"op": "nouvelle", "mode": "Classique", "graine": 12, "chrono": 60}
+  {"op": "jouer", "session": "...", "x": 0, "y": 3}
+  {"op": "etat", "session": "..."}
+  {"op": "fermer", "session": "..."}
+Réponses : {"ok": true, ...} ou {"ok": false, "erreur": "..."}.
+Quand le chrono d'une partie expire, le serveur pousse
+  {"evenement": "chrono_expire", "session": "...", "score": ...}
+sur la dernière connexion qui a utilisé la session.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import sys
+import time
+
+from chasse_tresor import MODES, MinuteurChrono, ModeleJeu
+
+HOTE = "127.0.0.1"
+PORT = 8765
+INACTIVITE_MAX = 300.0      # secondes sans requête avant expiration d'une session
+LIGNE_MAX = 64 * 1024
+
+
+# -------------------------
+# Roue temporelle
+# -------------------------
+class RoueTemporelle:
+    """
+    Roue de minuteurs hachée : `taille` cases de `resolution` secondes.
+    Planifier / annuler en O(1) ; une seule tâche avance la roue, et dort
+    tant qu'aucun minuteur n'est actif.
+    """
+
+    def __init__(self, resolution=0.05, taille=1024, horloge=time.monotonic):
+        self.resolution = resolution
+        self.taille = taille
+        self.horloge = horloge
+        self.cases = [[] for _ in range(taille)]
+        self.actifs = 0
+        self.tic = int(horloge() / resolution)
+        self._reveil = asyncio.Event()
+
+    def planifier(self, echeance, rappel, *args):
+        """Appelle rappel(*args) à l'instant `echeance` (horloge de la roue). Renvoie un minuteur."""
+        minuteur = [echeance, rappel, args, True]
+        tic = max(int(echeance / self.resolution), self.tic)
+        self.cases[tic % self.taille].append(minuteur)
+        self.actifs += 1
+        self._reveil.set()
+        return minuteur
+
+    def annuler(self, minuteur):
+        if minuteur is not None and minuteur[3]:
+            minuteur[3] = False
+            self.actifs -= 1
+
+    def avancer(self, maintenant):
+        """Déclenche les minuteurs échus jusqu'à `maintenant`."""
+        fin = int(maintenant / self.resolution)
+        # au-delà d'un tour complet, chaque case n'a besoin d'être vue qu'une fois
+        debut = max(self.tic, fin - self.taille + 1)
+        for tic in range(debut, fin + 1):
+            case = self.cases[tic % self.taille]
+            if not case:
+                continue
+            restants = []
+            # un rappel peut replanifier dans cette case : la boucle voit aussi ces ajouts
+            for minuteur in case:
+                if not minuteur[3]:
+                    continue
+                if minuteur[0] <= maintenant:
+                    minuteur[3] = False
+                    self.actifs -= 1
+                    minuteur[1](*minuteur[2])
+                else:
+                    restants.append(minuteur)
+            self.cases[tic % self.taille] = restants
+        self.tic = fin
+
+    async def tourner(self):
+        while True:
+            if not self.actifs:
+                self._reveil.clear()
+                await self._reveil.wait()
+                self.tic = int(self.horloge() / self.resolution)
+            await asyncio.sleep(self.resolution)
+            self.avancer(self.horloge())
+
+
+# -------------------------
+# Sessions
+# -------------------------
+class Session:
+    __slots__ = ("id", "modele", "derniere", "ecrivain", "minuteur_chrono", "minuteur_inactivite")
+
+    def __init__(self, id, modele, maintenant):
+        self.id = id
+        self.modele = modele
+        self.derniere = maintenant
+        self.ecrivain = None
+        self.minuteur_chrono = None
+        self.minuteur_inactivite = None
+
+
+class ErreurRequete(Exception):
+    """Requête invalide : renvoyée au client dans {"ok": false}."""
+
+
+class ServeurChasse:
+    def __init__(self, inactivite_max=INACTIVITE_MAX, horloge=time.monotonic):
+        self.inactivite_max = inactivite_max
+        self.horloge = horloge
+        self.sessions = {}
+        self.roue = None
+        self.requetes = 0
+
+    # --- minuteurs ---
+    def _verifier_inactivite(self, sid):
+        session = self.sessions.get(sid)
+        if session is None:
+            return
+        limite = session.derniere + self.inactivite_max
+        if self.horloge() >= limite:
+            self._fermer(session)
+        else:
+            # activité entre-temps : on replanifie plutôt que de toucher la roue à chaque requête
+            session.minuteur_inactivite = self.roue.planifier(limite, self._verifier_inactivite, sid)
+
+    def _chrono_expire(self, sid):
+        session = self.sessions.get(sid)
+        if session is None:
+            return
+        self._pousser(session, {"evenement": "chrono_expire", "session": sid,
+                                "score": session.modele.score})
+
+    def _pousser(self, session, message):
+        ecrivain = session.ecrivain
+        if ecrivain is not None and not ecrivain.is_closing():
+            ecrivain.write(json.dumps(message).encode() + b"\n")
+
+    def _fermer(self, session):
+        if session.minuteur_chrono is not None:
+            session.minuteur_chrono.arreter()
+        self.roue.annuler(session.minuteur_inactivite)
+        del self.sessions[session.id]
+
+    # --- opérations ---
+    def _session(self, requete):
+        sid = requete.get("session")
+        session = self.sessions.get(sid) if isinstance(sid, str) else None
+        if session is None:
+            raise ErreurRequete("session inconnue ou expirée")
+        session.derniere = self.horloge()
+        return session
+
+    def op_nouvelle(self, requete, ecrivain):
+        mode = requete.get("mode", "Classique")
+        if not isinstance(mode, str) or mode not in MODES:
+            raise ErreurRequete(f"mode inconnu : {mode}")
+        params = dict(MODES[mode])
+        if mode == "Chrono" and "chrono" in requete:
+            try:
+                chrono = int(requete["chrono"])
+            except (TypeError, ValueError, OverflowError):
+                raise ErreurRequete("chrono entier attendu (secondes)") from None
+            params["chrono"] = max(10, min(600, chrono))
+        graine = requete.get("graine")
+        if graine is not None and not isinstance(graine, (int, str)):
+            raise ErreurRequete("graine entière ou chaîne attendue")
+        rng = random.Random(graine) if graine is not None else None
+        modele = ModeleJeu(mode=mode, rng=rng, plateau="compact", horloge=self.horloge, **params)
+
+        sid = secrets.token_hex(8)
+        session = self.sessions[sid] = Session(sid, modele, self.horloge())
+        session.ecrivain = ecrivain
+        session.minuteur_inactivite = self.roue.planifier(
+            session.derniere + self.inactivite_max, self._verifier_inactivite, sid)
+        return {"session": sid, "mode": mode, "taille": modele.taille,
+                "max_tentatives": modele.max_tentatives, "chrono": modele.chrono}
+
+    def op_jouer(self, requete, ecrivain):
+        session = self._session(requete)
+        session.ecrivain = ecrivain
+        modele = session.modele
+        try:
+            x, y = int(requete["x"]), int(requete["y"])
+        except (KeyError, TypeError, ValueError, OverflowError):
+            raise ErreurRequete("x et y entiers attendus") from None
+        if not (0 <= x < modele.taille and 0 <= y < modele.taille):
+            raise ErreurRequete("case hors du plateau")
+
+        premier = modele.start_time is None
+        resultat = modele.jouer_case(x, y)
+        if premier and modele.echeance is not None:
+            # pas de sur_seconde : un seul minuteur, à l'échéance
+            session.minuteur_chrono = MinuteurChrono(
+                modele,
+                planifier=lambda delai, rappel: self.roue.planifier(self.horloge() + delai, rappel),
+                annuler=self.roue.annuler,
+                sur_expiration=lambda: self._chrono_expire(session.id),
+            )
+            session.minuteur_chrono.demarrer()
+        # même règle que InterfaceChasse.clic_case
+        if (resultat != "victoire" and not modele.finished
+                and modele.tentatives >= modele.max_tentatives):
+            modele.finished = True
+            resultat = "perdu"
+        if modele.finished and session.minuteur_chrono is not None:
+            session.minuteur_chrono.arreter()
+        return {"resultat": resultat, **self._etat(modele)}
+
+    def op_etat(self, requete, ecrivain):
+        return self._etat(self._session(requete).modele)
+
+    def op_fermer(self, requete, ecrivain):
+        self._fermer(self._session(requete))
+        return {}
+
+    def _etat(self, modele):
+        etat = {"score": modele.score, "tentatives": modele.tentatives, "fini": modele.finished}
+        if modele.mode == "Chrono":
+            etat["restant"] = modele.restant()
+        return etat
+
+    OPERATIONS = {
+        "nouvelle": op_nouvelle,
+        "jouer": op_jouer,
+        "etat": op_etat,
+        "fermer": op_fermer,
+    }
+
+    def traiter(self, ligne, ecrivain):
+        """
+        Une ligne JSON -> un dict de réponse. jouer_case ne coûte que quelques µs : pas de thread.
+        Toute requête mal formée (JSON invalide, champ du mauvais type) donne {"ok": false}.
+        """
+        self.requetes += 1
+        requete = {}
+        try:
+            requete = json.loads(ligne)
+            if not isinstance(requete, dict):
+                raise ErreurRequete("objet JSON attendu")
+            nom = requete.get("op")
+            op = self.OPERATIONS.get(nom) if isinstance(nom, str) else None
+            if op is None:
+                raise ErreurRequete(f"opération inconnue : {requete.get('op')!r}")
+            reponse = {"ok": True, **op(self, requete, ecrivain)}
+        except ErreurRequete as e:
+            reponse = {"ok": False, "erreur": str(e)}
+        except (ValueError, RecursionError) as e:
+            # RecursionError : JSON trop imbriqué
+            reponse = {"ok": False, "erreur": f"requête invalide : {e}"}
+        if isinstance(requete, dict) and "id" in requete:
+            reponse["id"] = requete["id"]
+        return reponse
+
+    # --- réseau ---
+    async def _client(self, lecteur, ecrivain):
+        try:
+            while True:
+                try:
+                    ligne = await lecteur.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not ligne:
+                    break
+                ecrivain.write(json.dumps(self.traiter(ligne, ecrivain)).encode() + b"\n")
+                await ecrivain.drain()
+        except ConnectionError:
+            pass
+        finally:
+            ecrivain.close()
+
+    async def servir(self, hote=HOTE, port=PORT, pret=None):
+        self.roue = RoueTemporelle(horloge=self.horloge)
+        roue = asyncio.create_task(self.roue.tourner())
+        serveur = await asyncio.start_server(self._client, hote, port, limit=LIGNE_MAX)
+        if pret is not None:
+            pret.set_result(serveur.sockets[0].getsockname()[1])
+        try:
+            async with serveur:
+                await serveur.serve_forever()
+        finally:
+            roue.cancel()
+
+
+# -------------------------
+# Client de charge
+# -------------------------
+def percentiles(valeurs, qs=(50, 95, 99)):
+    valeurs = sorted(valeurs)
+    n = len(valeurs)
+    if not n:
+        return [0.0] * len(qs)
+    return [valeurs[min(n - 1, max(0, -(-q * n // 100) - 1))] for q in qs]
+
+
+async def _joueur(hote, port, parties, graine, latences):
+    lecteur, ecrivain = await asyncio.open_connection(hote, port, limit=LIGNE_MAX)
+    rng = random.Random(graine)
+
+    async def requete(message):
+        t0 = time.perf_counter()
+        ecrivain.write(json.dumps(message).encode() + b"\n")
+        while True:
+            reponse = json.loads(await lecteur.readline())
+            if "evenement" not in reponse:
+                break
+        latences.append(time.perf_counter() - t0)
+        if not reponse["ok"]:
+            raise RuntimeError(reponse["erreur"])
+        return reponse
+
+    for _ in range(parties):
+        mode = rng.choice(list(MODES))
+        partie = await requete({"op": "nouvelle", "mode": mode})
+        t = partie["taille"]
+        for c in rng.sample(range(t * t), t * t):
+            etat = await requete({"op": "jouer", "session": partie["session"],
+                                  "x": c // t, "y": c % t})
+            if etat["fini"]:
+                break
+        await requete({"op": "fermer", "session": partie["session"]})
+    ecrivain.close()
+
+
+async def charger(hote, port, clients, parties):
+    latences = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_joueur(hote, port, parties, i, latences) for i in range(clients)))
+    dt = time.perf_counter() - t0
+    p50, p95, p99 = percentiles(latences)
+    print(f"{clients} clients x {parties} parties : {len(latences)} requêtes en {dt:.2f} s "
+          f"({len(latences) / dt:,.0f} req/s)")
+    print(f"latence p50 {p50 * 1e3:.2f} ms  p95 {p95 * 1e3:.2f} ms  p99 {p99 * 1e3:.2f} ms")
+
+
+async def _charge_locale(clients, parties):
+    """Serveur et client de charge dans le même processus, sur un port libre."""
+    serveur = ServeurChasse()
+    pret = asyncio.get_running_loop().create_future()
+    tache = asyncio.create_task(serveur.servir(HOTE, 0, pret))
+    port = await pret
+    try:
+        await charger(HOTE, port, clients, parties)
+    finally:
+        tache.cancel()
+    print(f"{len(serveur.sessions)} session(s) encore ouvertes")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serveur multi-sessions de la Chasse au Trésor")
+    sous = ap.add_subparsers(dest="commande", required=True)
+    s = sous.add_parser("serveur", help="lance le serveur")
+    s.add_argument("--hote", default=HOTE)
+    s.add_argument("--port", type=int, default=PORT)
+    s.add_argument("--inactivite", type=float, default=INACTIVITE_MAX,
+                   help="secondes d'inactivité avant expiration d'une session")
+    c = sous.add_parser("charge", help="client de charge")
+    c.add_argument("--hote", default=HOTE)
+    c.add_argument("--port", type=int, default=None,
+                   help="serveur existant (par défaut : serveur lancé dans le même processus)")
+    c.add_argument("--clients", type=int, default=200)
+    c.add_argument("--parties", type=int, default=20, help="parties par client")
+    args = ap.parse_args(argv)
+
+    try:
+        if args.commande == "serveur":
+            print(f"écoute sur {args.hote}:{args.port}", file=sys.stderr)
+            asyncio.run(ServeurChasse(args.inactivite).servir(args.hote, args.port))
+        elif args.port is None:
+            asyncio.run(_charge_locale(args.clients, args.parties))
+        else:
+            asyncio.run(charger(args.hote, args.port, args.clients, args.parties))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chasse au Trésor - Simulation de parties en masse (sans Tk)
+- Joue ModeleJeu directement, avec des stratégies de clic interchangeables
+- Modes Classique, Chrono (horloge virtuelle, temps de réflexion par clic) et Difficile
+- Parties seedées réparties sur un ProcessPoolExecutor
+- Taux de victoire et distribution des scores par configuration
+
+  python simulation_chasse.py --parties 1000000
+  python simulation_chasse.py --modes Difficile --strategies aleatoire,oracle --json res.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from chasse_tresor import MODES, ModeleJeu
+
+
+# -------------------------
+# Stratégies de clic
+# -------------------------
+# Une stratégie reçoit le modèle (partie fraîchement tirée) et un random.Random,
+# et renvoie un itérable de cases (x, y) dans l'ordre des clics.
+def aleatoire(modele, rng):
+    """Cases dans un ordre aléatoire, sans jamais recliquer."""
+    t = modele.taille
+    return (divmod(c, t) for c in rng.sample(range(t * t), t * t))
+
+
+def balayage(modele, rng):
+    """Ligne par ligne depuis le coin haut gauche."""
+    t = modele.taille
+    return ((x, y) for x in range(t) for y in range(t))
+
+
+def damier(modele, rng):
+    """Une case sur deux d'abord (cases noires du damier), puis les autres."""
+    t = modele.taille
+    cases = [(x, y) for x in range(t) for y in range(t)]
+    return [c for c in cases if sum(c) % 2 == 0] + [c for c in cases if sum(c) % 2]
+
+
+def oracle(modele, rng):
+    """Connaît le plateau : borne haute (trésors seulement)."""
+    return sorted(modele.tresors)
+
+
+STRATEGIES = {
+    "aleatoire": aleatoire,
+    "balayage": balayage,
+    "damier": damier,
+    "oracle": oracle,
+}
+
+
+class HorlogeVirtuelle:
+    """Horloge pour le mode Chrono : avance du temps de réflexion à chaque clic."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+# -------------------------
+# Simulation
+# -------------------------
+def jouer(modele, strategie, rng, horloge=None, cadence=1.0):
+    """
+    Joue une partie jusqu'au bout, comme InterfaceChasse.clic_case.
+    Renvoie (victoire, score, tentatives).
+    """
+    for x, y in strategie(modele, rng):
+        if horloge is not None:
+            horloge.t += rng.expovariate(1.0 / cadence)
+        resultat = modele.jouer_case(x, y)
+        if resultat == "victoire":
+            return True, modele.score, modele.tentatives
+        if resultat == "perdu":
+            break
+        if modele.tentatives >= modele.max_tentatives:
+            break
+    modele.finished = True
+    return False, modele.score, modele.tentatives
+
+
+def jouer_tranche(mode, strategie, graines, cadence=1.0, plateau="compact"):
+    """Joue une tranche de parties (exécuté dans un processus du pool)."""
+    params = MODES[mode]
+    choix = STRATEGIES[strategie]
+    victoires = 0
+    scores = Counter()
+    tentatives = Counter()
+    horloge = HorlogeVirtuelle() if mode == "Chrono" else None
+    rng = random.Random()
+    modele = ModeleJeu(mode=mode, rng=rng, plateau=plateau, horloge=horloge or time.monotonic, **params)
+    for graine in graines:
+        # un seul modèle réutilisé : la partie n dépend uniquement de la graine n
+        rng.seed(graine)
+        modele.reset()
+        gagne, score, essais = jouer(modele, choix, rng, horloge, cadence)
+        victoires += gagne
+        scores[score] += 1
+        tentatives[essais] += 1
+    return victoires, scores, tentatives
+
+
+def percentile(compte, q):
+    """Percentile (rang le plus proche) d'une distribution donnée en Counter."""
+    n = sum(compte.values())
+    rang = max(1, -(-q * n // 100))
+    cumul = 0
+    for valeur in sorted(compte):
+        cumul += compte[valeur]
+        if cumul >= rang:
+            return valeur
+    return 0
+
+
+def decrire(compte):
+    n = sum(compte.values())
+    moyenne = sum(v * k for v, k in compte.items()) / n if n else 0.0
+    return {
+        "moyenne": moyenne,
+        "min": min(compte, default=0), "p50": percentile(compte, 50),
+        "p95": percentile(compte, 95), "max": max(compte, default=0),
+        "distribution": {str(v): compte[v] for v in sorted(compte)},
+    }
+
+
+def simuler(configs, parties, processus=None, tranche=None, graine=0, cadence=1.0,
+            plateau="compact"):
+    """
+    Générateur : produit ((mode, stratégie), stats) dès qu'une configuration est terminée.
+    Les mêmes graines (donc les mêmes plateaux) servent à toutes les stratégies d'un mode.
+    """
+    processus = processus or os.cpu_count() or 1
+    tranche = tranche or max(1, min(50_000, parties // (processus * 4)))
+    bornes = [(d, min(d + tranche, parties)) for d in range(0, parties, tranche)]
+
+    restant = {}
+    totaux = {}
+    with ProcessPoolExecutor(max_workers=processus) as pool:
+        futures = {}
+        for config in configs:
+            mode, strategie = config
+            restant[config] = len(bornes)
+            totaux[config] = [0, Counter(), Counter()]
+            for debut, fin in bornes:
+                graines = range(graine + debut, graine + fin)
+                fut = pool.submit(jouer_tranche, mode, strategie, graines, cadence, plateau)
+                futures[fut] = config
+        for fut in as_completed(futures):
+            config = futures[fut]
+            victoires, scores, tentatives = fut.result()
+            total = totaux[config]
+            total[0] += victoires
+            total[1].update(scores)
+            total[2].update(tentatives)
+            restant[config] -= 1
+            if restant[config] == 0:
+                victoires, scores, tentatives = totaux.pop(config)
+                yield config, {
+                    "parties": parties,
+                    "taux_victoire": victoires / parties,
+                    "score": decrire(scores),
+                    "tentatives": decrire(tentatives),
+                }
+
+
+# -------------------------
+# CLI
+# -------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulation en masse de la Chasse au Trésor")
+    ap.add_argument("--modes", default=",".join(MODES), help="liste séparée par des virgules")
+    ap.add_argument("--strategies", default=",".join(STRATEGIES), help="liste séparée par des virgules")
+    ap.add_argument("--parties", type=int, default=100_000, help="parties par configuration")
+    ap.add_argument("--graine", type=int, default=0, help="première graine")
+    ap.add_argument("--processus", type=int, default=None)
+    ap.add_argument("--tranche", type=int, default=None, help="parties par tâche")
+    ap.add_argument("--cadence", type=float, default=1.0,
+                    help="temps de réflexion moyen par clic en mode Chrono (s)")
+    ap.add_argument("--plateau", choices=("ensembles", "compact"), default="compact")
+    ap.add_argument("--json", metavar="FICHIER", help="écrit aussi les résultats en JSON")
+    args = ap.parse_args(argv)
+
+    modes = args.modes.split(",")
+    strategies = args.strategies.split(",")
+    for m in modes:
+        if m not in MODES:
+            ap.error(f"mode inconnu : {m}")
+    for s in strategies:
+        if s not in STRATEGIES:
+            ap.error(f"stratégie inconnue : {s}")
+    configs = [(m, s) for m in modes for s in strategies]
+
+    print(f"{len(configs)} configurations x {args.parties} parties", file=sys.stderr)
+    print("mode        stratégie  | victoires | score moy  p50  p95 | tentatives moy")
+    lignes = []
+    t0 = time.perf_counter()
+    for (mode, strategie), stats in simuler(configs, args.parties, args.processus, args.tranche,
+                                            args.graine, args.cadence, args.plateau):
+        sc, te = stats["score"], stats["tentatives"]
+        print(f"{mode:<11} {strategie:<10} | {stats['taux_victoire']:8.2%} | "
+              f"{sc['moyenne']:9.2f} {sc['p50']:4d} {sc['p95']:4d} | {te['moyenne']:8.2f}", flush=True)
+        lignes.append({"mode": mode, "strategie": strategie, **stats})
+    dt = time.perf_counter() - t0
+    total = len(configs) * args.parties
+    print(f"terminé en {dt:.1f} s ({total / dt:,.0f} parties/s)", file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(lignes, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chasse au Trésor - Solveur exact (probabilité de victoire, score attendu)
+- Aucune case ne renseigne sur ses voisines : tous les ordres de clic sans
+  reclic se valent, la stratégie optimale est « n'importe quelle case cachée »
+- Programmation dynamique sur (trésors trouvés, pièges touchés, score) couche
+  par couche de clics : les plateaux ne sont jamais énumérés, seuls les comptes
+  comptent (symétrie) ; vides touchés et tentatives restantes s'en déduisent
+- Résultats en flottants mis en cache sur disque (solveur_chasse.json),
+  ou en fractions exactes (--exact, sans cache)
+- Le chrono n'est pas modélisé : le mode Chrono est noté sans limite de temps
+
+  python solveur_chasse.py                           # modes du jeu
+  python solveur_chasse.py 8 5 6 20 --mode Difficile
+  python solveur_chasse.py --verifier 100000         # comparaison avec simulation_chasse
+"""
+
+import argparse
+import json
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from chasse_tresor import MODES
+from classement import ecrire_atomique, signature
+
+FICHIER_CACHE = "solveur_chasse.json"
+
+# barème de ModeleJeu.jouer_case
+GAIN_TRESOR = 10
+PERTE_PIEGE = 5
+PERTE_VIDE = {"Difficile": 1}
+
+# probabilités d'état en dessous de ce seuil mises à zéro (calcul en flottants)
+NEGLIGEABLE = 1e-250
+
+# (probabilité de victoire minimale, note)
+NIVEAUX = ((0.9, "facile"), (0.6, "moyen"), (0.3, "difficile"), (0.0, "extrême"))
+
+
+def verifier_config(taille, nb_tresors, nb_pieges, max_tentatives):
+    """Mêmes contrôles que ModeleJeu."""
+    if taille < 1:
+        raise ValueError(f"taille de plateau invalide : {taille}")
+    if nb_tresors < 1 or nb_pieges < 0:
+        raise ValueError(f"nombre de trésors / pièges invalide : {nb_tresors} / {nb_pieges}")
+    if nb_tresors + nb_pieges > taille * taille:
+        raise ValueError(
+            f"{nb_tresors} trésors + {nb_pieges} pièges ne tiennent pas sur {taille}x{taille} cases")
+    if max_tentatives < 0:
+        raise ValueError(f"nombre de tentatives invalide : {max_tentatives}")
+
+
+def note(victoire):
+    for seuil, nom in NIVEAUX:
+        if victoire >= seuil:
+            return nom
+    return NIVEAUX[-1][1]
+
+
+# -------------------------
+# Solveur
+# -------------------------
+def _ajouter_decale(dest, x, k):
+    """dest[..., s] += x[..., s + k] : score s -> max(0, s - k) (plancher à 0 de ModeleJeu)."""
+    if not k:
+        dest += x
+        return
+    dest[..., :-k] += x[..., k:]
+    dest[..., 0] += x[..., :k].sum(axis=-1)
+
+
+def resoudre(taille, nb_tresors, nb_pieges, max_tentatives, mode="Classique", exact=False):
+    """
+    Issue exacte d'une partie jouée jusqu'au bout.
+    Après d clics, l'état est (trésors trouvés, pièges touchés, score) : les vides
+    touchés valent d - trésors - pièges. Une couche de d est un tableau
+    T x (P+1) x (10T+1) de probabilités, poussé d'un clic à la fois dans des
+    tampons réutilisés.
+    exact=True : fractions (tableaux object) au lieu de flottants.
+    """
+    verifier_config(taille, nb_tresors, nb_pieges, max_tentatives)
+    cases = taille * taille
+    vides = cases - nb_tresors - nb_pieges
+    clics = min(max_tentatives, cases)
+    penalite = PERTE_VIDE.get(mode, 0)
+    dtype = object if exact else np.float64
+    zero = Fraction(0) if exact else 0.0
+    nb_scores = GAIN_TRESOR * nb_tresors + 1
+    forme = (nb_tresors, nb_pieges + 1, nb_scores)
+
+    couche, suivante, produit = (np.full(forme, zero, dtype) for _ in range(3))
+    masque = np.empty(forme, bool)
+    couche[0, 0, 0] = Fraction(1) if exact else 1.0
+    victoire = np.full(nb_scores, zero, dtype)
+    tentatives = zero
+    etats = 1
+
+    a = np.arange(nb_tresors)[:, None]
+    b = np.arange(nb_pieges + 1)[None, :]
+    t = np.broadcast_to(nb_tresors - a, forme[:2])
+    p = np.broadcast_to(nb_pieges - b, forme[:2])
+    for clic in range(clics):
+        # comptes encore cachés avant ce clic, pour chaque (trouvés, touchés)
+        n = cases - clic
+        v = np.maximum(vides - (clic - a - b), 0)
+        if exact:
+            inv = Fraction(1, n)
+            pt, pp, pv = (x.astype(object) * inv for x in (t, p, v))
+        else:
+            pt, pp, pv = t / n, p / n, v / n
+
+        suivante.fill(zero)
+        np.multiply(couche, pt[:, :, None], out=produit)
+        # dernier trésor : victoire avec le score + 10
+        gagne = produit[-1].sum(axis=0)
+        victoire[GAIN_TRESOR:] += gagne[:-GAIN_TRESOR]
+        tentatives += gagne.sum() * (clic + 1)
+        suivante[1:, :, GAIN_TRESOR:] += produit[:-1, :, :-GAIN_TRESOR]
+        np.multiply(couche, pp[:, :, None], out=produit)
+        _ajouter_decale(suivante[:, 1:, :], produit[:, :-1, :], PERTE_PIEGE)
+        np.multiply(couche, pv[:, :, None], out=produit)
+        _ajouter_decale(suivante, produit, penalite)
+        if not exact:
+            # flottants dénormalisés (parties improbables) : négligeables et très lents
+            np.less(suivante, NEGLIGEABLE, out=masque)
+            np.putmask(suivante, masque, 0.0)
+        couche, suivante = suivante, couche
+        vivants = int(np.count_nonzero(couche))
+        if not vivants:
+            break
+        etats += vivants
+
+    # tentatives épuisées avant le dernier trésor
+    defaite = couche.sum(axis=(0, 1))
+    tentatives += defaite.sum() * clics
+
+    proba_victoire = victoire.sum()
+    score_victoire = (victoire * np.arange(nb_scores)).sum()
+    loi = victoire + defaite
+    distribution = {s: loi[s] for s in np.flatnonzero(loi).tolist()}
+    if not exact:
+        proba_victoire, score_victoire, tentatives = (
+            float(proba_victoire), float(score_victoire), float(tentatives))
+        distribution = {s: float(pr) for s, pr in distribution.items()}
+    return {
+        "victoire": proba_victoire,
+        "score_moyen": sum((pr * s for s, pr in distribution.items()), zero),
+        "score_moyen_victoire": score_victoire / proba_victoire if proba_victoire else zero,
+        "tentatives_moyennes": tentatives,
+        "difficulte": note(proba_victoire),
+        "etats": etats,
+        "distribution": distribution,
+    }
+
+
+# -------------------------
+# Cache disque
+# -------------------------
+_caches = {}    # chemin -> (signature, table)
+
+
+def _cle(taille, nb_tresors, nb_pieges, max_tentatives, mode):
+    # seules les règles comptent : Classique et Chrono partagent leurs entrées
+    clics = min(max_tentatives, taille * taille)
+    return f"{taille}/{nb_tresors}/{nb_pieges}/{clics}/{PERTE_VIDE.get(mode, 0)}"
+
+
+def _lire_cache(chemin):
+    sig = signature(chemin)
+    connu = _caches.get(chemin)
+    if connu is not None and connu[0] == sig:
+        return connu[1]
+    try:
+        with open(chemin, "r", encoding="utf-8") as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        table = {}
+    if not isinstance(table, dict):
+        table = {}
+    _caches[chemin] = (sig, table)
+    return table
+
+
+def evaluer(taille, nb_tresors, nb_pieges, max_tentatives, mode="Classique", cache=FICHIER_CACHE):
+    """resoudre() en flottants, relu depuis `cache` si la configuration est déjà connue."""
+    cle = _cle(taille, nb_tresors, nb_pieges, max_tentatives, mode)
+    table = _lire_cache(cache) if cache else {}
+    if cle not in table:
+        res = resoudre(taille, nb_tresors, nb_pieges, max_tentatives, mode)
+        res["distribution"] = {str(s): pr for s, pr in res["distribution"].items()}
+        if cache:
+            # relire juste avant d'écrire : un autre processus a pu compléter le cache
+            _caches.pop(cache, None)
+            table = dict(_lire_cache(cache), **{cle: res})
+            ecrire_atomique(cache, json.dumps(table, ensure_ascii=False).encode("utf-8"))
+            _caches[cache] = (signature(cache), table)
+        else:
+            table = {cle: res}
+    return dict(table[cle], taille=taille, nb_tresors=nb_tresors, nb_pieges=nb_pieges,
+                max_tentatives=max_tentatives, mode=mode)
+
+
+# -------------------------
+# CLI
+# -------------------------
+def verifier(configs, parties):
+    """Compare le solveur à simulation_chasse (stratégie aléatoire)."""
+    from simulation_chasse import decrire, jouer_tranche
+    print("mode        | victoire solveur  simulation | score solveur  simulation")
+    for mode in configs:
+        res = evaluer(mode=mode, cache=None, **{k: v for k, v in MODES[mode].items() if k != "chrono"})
+        # clics quasi instantanés : le chrono n'expire jamais, comme dans le solveur
+        victoires, scores, _ = jouer_tranche(mode, "aleatoire", range(parties), cadence=1e-9)
+        print(f"{mode:<11} | {res['victoire']:16.4%} {victoires / parties:11.4%} | "
+              f"{res['score_moyen']:13.3f} {decrire(scores)['moyenne']:11.3f}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Probabilité de victoire et score attendu exacts")
+    ap.add_argument("config", nargs="*", type=int,
+                    metavar="N", help="taille nb_tresors nb_pieges max_tentatives (défaut : modes du jeu)")
+    ap.add_argument("--mode", default="Classique", choices=tuple(MODES),
+                    help="barème appliqué à une configuration explicite")
+    ap.add_argument("--exact", action="store_true", help="fractions exactes (pas de cache)")
+    ap.add_argument("--cache", default=FICHIER_CACHE)
+    ap.add_argument("--sans-cache", action="store_true")
+    ap.add_argument("--distribution", action="store_true", help="affiche la loi du score final")
+    ap.add_argument("--json", action="store_true", help="résultats en JSON sur la sortie standard")
+    ap.add_argument("--verifier", type=int, metavar="PARTIES",
+                    help="compare les modes du jeu à autant de parties simulées")
+    args = ap.parse_args(argv)
+
+    if args.verifier:
+        verifier(list(MODES), args.verifier)
+        return
+    if args.config and len(args.config) != 4:
+        ap.error("attendu : taille nb_tresors nb_pieges max_tentatives")
+    if args.config:
+        configs = [(f"{args.config[0]}x{args.config[0]}", args.mode, args.config)]
+    else:
+        configs = [(mode, mode, [p["taille"], p["nb_tresors"], p["nb_pieges"], p["max_tentatives"]])
+                   for mode, p in MODES.items()]
+
+    cache = None if args.sans_cache else args.cache
+    resultats = []
+    if not args.json:
+        print("config      | victoire | score moy | si victoire | tentatives | difficulté | états |     ms")
+    for nom, mode, (taille, tresors, pieges, tentatives) in configs:
+        t0 = time.perf_counter()
+        try:
+            if args.exact:
+                res = resoudre(taille, tresors, pieges, tentatives, mode, exact=True)
+            else:
+                res = evaluer(taille, tresors, pieges, tentatives, mode, cache=cache)
+        except ValueError as e:
+            ap.error(str(e))
+        ms = (time.perf_counter() - t0) * 1000
+        resultats.append(dict(res, config=nom, mode=mode))
+        if args.json:
+            continue
+        print(f"{nom:<11} | {float(res['victoire']):8.2%} | {float(res['score_moyen']):9.2f} | "
+              f"{float(res['score_moyen_victoire']):11.2f} | {float(res['tentatives_moyennes']):10.2f} | "
+              f"{res['difficulte']:<10} | {res['etats']:5d} | {ms:6.2f}")
+        if args.exact:
+            print(f"            victoire = {res['victoire']}, score moyen = {res['score_moyen']}")
+        if args.distribution:
+            for s, pr in res["distribution"].items():
+                print(f"            score {s:>4} : {float(pr):8.4%}")
+    if args.json:
+        json.dump(resultats, sys.stdout, indent=2, ensure_ascii=False, default=str)
+        print()
+
+
+if __name__ == "__main__":
+    main()
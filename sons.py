@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sons partagés par Cyber Runner et la Chasse au Trésor
+- pygame.mixer ouvert paresseusement, au premier precharger() et sur le thread
+  appelant (l'initialisation des sous-systèmes SDL n'est pas thread-safe) :
+  importer un jeu ne coûte plus l'ouverture de la sortie audio
+- Effets synthétisés une seule fois avec NumPy dans un thread d'arrière-plan,
+  écrits directement dans le tampon des pygame.mixer.Sound
+  (pygame.sndarray.samples, sans copie) ; attendre() avant pygame.quit()
+- Lecture non bloquante, sans attente : un son demandé avant la fin du
+  chargement est simplement ignoré
+- Silencieux si pygame, NumPy ou la sortie audio sont indisponibles
+
+  python sons.py bench     # démarrage à froid des deux jeux, chargement des sons
+  python sons.py jouer     # écoute de tous les effets
+"""
+
+import atexit
+import os
+import subprocess
+import sys
+import threading
+import time
+
+FREQUENCE = 22050
+VOLUME = 0.35
+
+
+# -------------------------
+# Synthèse (NumPy)
+# -------------------------
+def _temps(np, duree, frequence):
+    return np.arange(int(duree * frequence), dtype=np.float32) / frequence
+
+
+def _enveloppe(np, t, attaque=0.005, decroissance=8.0):
+    return np.minimum(t / attaque, 1.0) * np.exp(-decroissance * t)
+
+
+def _tresor(np, f):
+    t = _temps(np, 0.25, f)
+    note = np.where(t < 0.08, 880.0, 1320.0)
+    return np.sin(2 * np.pi * note * t) * _enveloppe(np, t, decroissance=10.0)
+
+
+def _piege(np, f):
+    t = _temps(np, 0.35, f)
+    bruit = np.random.default_rng(1).uniform(-1, 1, t.size).astype(np.float32)
+    frequence = 220.0 - 110.0 * t / t[-1]
+    carre = np.sign(np.sin(2 * np.pi * np.cumsum(frequence) / f))
+    return (0.6 * carre + 0.4 * bruit) * _enveloppe(np, t, decroissance=7.0)
+
+
+def _victoire(np, f):
+    notes = (523.25, 659.25, 783.99, 1046.5)
+    t = _temps(np, 0.12 * len(notes) + 0.2, f)
+    indice = np.minimum((t / 0.12).astype(np.int64), len(notes) - 1)
+    note = np.asarray(notes, dtype=np.float32)[indice]
+    local = t - 0.12 * indice
+    return np.sin(2 * np.pi * note * t) * _enveloppe(np, local, decroissance=6.0)
+
+
+def _saut(np, f):
+    t = _temps(np, 0.15, f)
+    frequence = 300.0 + 400.0 * t / t[-1]
+    return np.sin(2 * np.pi * np.cumsum(frequence) / f) * _enveloppe(np, t, decroissance=14.0)
+
+
+def _crash(np, f):
+    t = _temps(np, 0.45, f)
+    bruit = np.random.default_rng(2).uniform(-1, 1, t.size).astype(np.float32)
+    grave = np.sin(2 * np.pi * 60.0 * t)
+    return (0.7 * bruit + 0.3 * grave) * _enveloppe(np, t, decroissance=6.0)
+
+
+EFFETS = {
+    "tresor": _tresor,
+    "piege": _piege,
+    "victoire": _victoire,
+    "saut": _saut,
+    "crash": _crash,
+}
+
+
+# -------------------------
+# Chargement et lecture
+# -------------------------
+class Sons:
+    def __init__(self, frequence=FREQUENCE, volume=VOLUME):
+        self.frequence = frequence
+        self.volume = volume
+        self.sons = {}
+        self.pret = threading.Event()
+        self.disponible = None      # None : pas encore essayé
+        self.duree_chargement = None
+        self._thread = None
+        self._verrou = threading.Lock()
+
+    def precharger(self):
+        """
+        Ouvre la sortie audio (une seule fois, depuis le thread principal), puis
+        synthétise les effets en arrière-plan et rend la main tout de suite.
+        """
+        with self._verrou:
+            if self._thread is not None or self.pret.is_set():
+                return
+            t0 = time.perf_counter()
+            try:
+                os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+                import pygame
+                if not pygame.mixer.get_init():
+                    pygame.mixer.pre_init(frequency=self.frequence, size=-16)
+                    pygame.mixer.init()
+                frequence, taille, canaux = pygame.mixer.get_init()
+                if taille != -16:
+                    raise RuntimeError(f"format audio non géré : {taille}")
+            except Exception:
+                self.disponible = False
+                self.duree_chargement = time.perf_counter() - t0
+                self.pret.set()
+                return
+            self._thread = threading.Thread(target=self._charger, args=(t0, frequence, canaux),
+                                            name="sons", daemon=True)
+            self._thread.start()
+            # avant le pygame.quit() de pygame à la sortie (atexit : dernier inscrit, premier appelé)
+            atexit.register(self.attendre)
+
+    def _charger(self, t0, frequence, canaux):
+        """Thread d'arrière-plan : synthèse NumPy et remplissage des tampons, pas d'appel SDL d'init."""
+        try:
+            import numpy as np
+            import pygame
+            sons = {}
+            for nom, synthese in EFFETS.items():
+                onde = synthese(np, frequence)
+                son = pygame.mixer.Sound(buffer=bytes(onde.size * 2 * canaux))
+                echantillons = pygame.sndarray.samples(son)  # vue sur le tampon du Sound
+                if echantillons.ndim == 2:
+                    echantillons = echantillons.T
+                np.multiply(onde, 32767 * self.volume, out=echantillons, casting="unsafe")
+                sons[nom] = son
+            self.sons = sons
+            self.disponible = True
+        except Exception:
+            self.disponible = False
+        finally:
+            self.duree_chargement = time.perf_counter() - t0
+            self.pret.set()
+
+    def attendre(self, timeout=None):
+        """Attend la fin du chargement en cours (à appeler avant pygame.quit())."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def jouer(self, nom):
+        """Joue un effet sans bloquer ; ne fait rien tant que les sons ne sont pas prêts."""
+        if not self.pret.is_set():
+            self.precharger()
+            return
+        son = self.sons.get(nom)
+        if son is not None:
+            son.play()
+
+
+SONS = Sons()
+
+
+# -------------------------
+# Mesures
+# -------------------------
+# (préparation non mesurée, code mesuré)
+DEMARRAGES = {
+    "chasse_tresor : import": ("pass", "import chasse_tresor"),
+    "game : import + Game()": ("pass", "import game; game.Game()"),
+    "dont pygame.mixer.init() (thread principal)": ("import pygame", "pygame.mixer.init()"),
+    "ancien coût évité : pygame.init()": ("import pygame", "pygame.init()"),
+}
+
+
+def bench(repetitions=5):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    dossier = os.path.dirname(os.path.abspath(__file__))
+    print(f"démarrage à froid (meilleur de {repetitions} processus)")
+    for nom, (preparation, code) in DEMARRAGES.items():
+        mesures = []
+        for _ in range(repetitions):
+            script = (f"import time; {preparation}; t0 = time.perf_counter(); {code}; "
+                      f"print(time.perf_counter() - t0)")
+            sortie = subprocess.run([sys.executable, "-c", script], cwd=dossier, env=env,
+                                    capture_output=True, text=True)
+            if sortie.returncode:
+                print(f"  {nom:<42} erreur : {sortie.stderr.strip().splitlines()[-1]}")
+                break
+            mesures.append(float(sortie.stdout.split()[-1]))
+        else:
+            print(f"  {nom:<42} {min(mesures) * 1000:7.1f} ms")
+
+    try:
+        import pygame   # déjà importé par les jeux au moment de precharger() : hors mesure
+    except ImportError:
+        pass
+    sons = Sons()
+    t0 = time.perf_counter()
+    sons.precharger()
+    appel = time.perf_counter() - t0
+    sons.pret.wait()
+    print(f"precharger() (mixer ouvert) rend la main en {appel * 1000:.1f} ms ; sons prêts en "
+          f"{sons.duree_chargement * 1000:.1f} ms en arrière-plan (disponible : {sons.disponible})")
+
+
+def ecouter():
+    SONS.precharger()
+    SONS.pret.wait()
+    if not SONS.disponible:
+        print("pas de sortie audio")
+        return
+    for nom in EFFETS:
+        print(nom)
+        SONS.jouer(nom)
+        time.sleep(0.8)
+
+
+if __name__ == "__main__":
+    commande = sys.argv[1] if len(sys.argv) > 1 else "bench"
+    if commande == "bench":
+        bench()
+    elif commande == "jouer":
+        ecouter()
+    else:
+        print(__doc__)
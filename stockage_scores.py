@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chasse au Trésor - Stockage des scores (sqlite3)
+- Historique complet : chaque victoire est une ligne ajoutée, rien n'est réécrit
+- Index (mode, score) : top N par mode sans parcourir l'historique
+- Journal WAL + busy_timeout : plusieurs processus peuvent écrire en même temps
+- Compactage atomique (checkpoint du journal puis VACUUM)
+- Import unique de l'ancien scores.json
+
+  python stockage_scores.py bench [--lignes 1000000]
+  python stockage_scores.py compacter
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+FICHIER_BASE = "scores.db"
+ANCIEN_FICHIER = "scores.json"
+ATTENTE_VERROU_MS = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id    INTEGER PRIMARY KEY,
+    nom   TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    mode  TEXT NOT NULL,
+    date  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_mode ON scores (mode, score DESC, date);
+CREATE INDEX IF NOT EXISTS scores_tous ON scores (score DESC, date);
+"""
+COLONNES = ("nom", "score", "mode", "date")
+
+
+class StockageScores:
+    def __init__(self, chemin=FICHIER_BASE, importer=ANCIEN_FICHIER):
+        self.chemin = chemin
+        self.importer = importer
+        self._connexion = None
+        self._pid = None
+
+    # --- connexion (une par processus) ---
+    @property
+    def connexion(self):
+        if self._connexion is None or self._pid != os.getpid():
+            cx = sqlite3.connect(self.chemin, timeout=ATTENTE_VERROU_MS / 1000, isolation_level=None)
+            cx.execute(f"PRAGMA busy_timeout = {ATTENTE_VERROU_MS}")
+            cx.execute("PRAGMA journal_mode = WAL")
+            cx.execute("PRAGMA synchronous = NORMAL")
+            cx.executescript(SCHEMA)
+            self._connexion, self._pid = cx, os.getpid()
+            if self.importer:
+                self._importer_json(self.importer)
+        return self._connexion
+
+    def fermer(self):
+        if self._connexion is not None and self._pid == os.getpid():
+            self._connexion.close()
+        self._connexion = None
+
+    def _importer_json(self, chemin):
+        """Reprend l'ancien scores.json une seule fois (base vide), sous verrou d'écriture."""
+        if not os.path.exists(chemin):
+            return
+        try:
+            with open(chemin, "r", encoding="utf-8") as f:
+                anciens = json.load(f)
+        except (OSError, ValueError):
+            return
+        cx = self._connexion
+        cx.execute("BEGIN IMMEDIATE")
+        try:
+            if cx.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is None:
+                cx.executemany(
+                    "INSERT INTO scores (nom, score, mode, date) VALUES (?, ?, ?, ?)",
+                    [(s.get("nom", "Anonyme"), int(s.get("score", 0)), s.get("mode", "—"),
+                      float(s.get("date", 0))) for s in anciens if isinstance(s, dict)])
+            cx.execute("COMMIT")
+        except BaseException:
+            cx.execute("ROLLBACK")
+            raise
+
+    # --- écriture ---
+    def ajouter(self, nom, score, mode, date=None):
+        self.ajouter_lot([(nom, score, mode, time.time() if date is None else date)])
+
+    def ajouter_lot(self, lignes):
+        """Ajoute des (nom, score, mode, date) en une seule transaction."""
+        cx = self.connexion
+        cx.execute("BEGIN IMMEDIATE")
+        try:
+            cx.executemany("INSERT INTO scores (nom, score, mode, date) VALUES (?, ?, ?, ?)", lignes)
+            cx.execute("COMMIT")
+        except BaseException:
+            cx.execute("ROLLBACK")
+            raise
+
+    def compacter(self):
+        """Vide le journal WAL dans la base puis la reconstruit (VACUUM est atomique)."""
+        cx = self.connexion
+        cx.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        cx.execute("VACUUM")
+
+    # --- lecture ---
+    def meilleurs(self, n=15, mode=None):
+        """Top n (tous modes ou un mode), sous forme de dicts comme dans l'ancien scores.json."""
+        if mode is None:
+            curseur = self.connexion.execute(
+                "SELECT nom, score, mode, date FROM scores ORDER BY score DESC, date LIMIT ?", (n,))
+        else:
+            curseur = self.connexion.execute(
+                "SELECT nom, score, mode, date FROM scores WHERE mode = ? "
+                "ORDER BY score DESC, date LIMIT ?", (mode, n))
+        return [dict(zip(COLONNES, ligne)) for ligne in curseur]
+
+    def __len__(self):
+        return self.connexion.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def bench(lignes=1_000_000):
+    rng = random.Random(0)
+    modes = ("Classique", "Chrono", "Difficile")
+    with tempfile.TemporaryDirectory() as dossier:
+        stock = StockageScores(os.path.join(dossier, "bench.db"), importer=None)
+        for taille in (1_000, lignes):
+            manque = taille - len(stock)
+            t0 = time.perf_counter()
+            stock.ajouter_lot((f"j{i}", rng.randrange(0, 60), rng.choice(modes), float(i))
+                              for i in range(manque))
+            ecriture = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for _ in range(1000):
+                stock.meilleurs(15, "Difficile")
+            lecture = (time.perf_counter() - t0) / 1000
+            t0 = time.perf_counter()
+            stock.ajouter("seul", 42, "Classique")
+            unitaire = time.perf_counter() - t0
+            print(f"{taille:>9} lignes : lot {manque / max(ecriture, 1e-9):,.0f} lignes/s, "
+                  f"ajout unitaire {unitaire * 1e3:.2f} ms, top 15 par mode {lecture * 1e6:.0f} µs")
+        t0 = time.perf_counter()
+        stock.compacter()
+        print(f"compactage : {time.perf_counter() - t0:.2f} s")
+        stock.fermer()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Stockage des scores de la Chasse au Trésor")
+    sous = ap.add_subparsers(dest="commande", required=True)
+    b = sous.add_parser("bench", help="écriture / lecture du top N selon la taille de l'historique")
+    b.add_argument("--lignes", type=int, default=1_000_000)
+    sous.add_parser("compacter", help=f"compacte {FICHIER_BASE}")
+    args = ap.parse_args(argv)
+    if args.commande == "bench":
+        bench(args.lignes)
+    else:
+        StockageScores().compacter()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""Motifs d'obstacles vérifiés : verify() et attente du sol avant un motif dans RunnerSim."""
+
+from runner_patterns import PatternIndex, verify, verify_bucket
+from runner_sim import (
+    DEFAULT_TUNING, EVENT_SPAWN, INPUT_JUMP, INPUT_NONE, START_SPEED, WIDTH, RunnerSim,
+)
+
+
+def test_motif_franchissable():
+    assert verify(((0, 70, 100),), 12) is not None
+    assert verify(((0, 40, 40),), START_SPEED) is not None
+
+
+def test_motif_long_a_basse_vitesse():
+    # plus de 200 frames à START_SPEED : l'horizon suit la longueur du motif
+    motif = ((0, 40, 40), (1200, 40, 40))
+    assert verify(motif, START_SPEED) > 200
+    assert verify_bucket([motif], START_SPEED, 1.0)
+
+
+def test_motif_impossible():
+    # trois obstacles hauts trop proches pour un seul saut, trop loin pour retomber entre
+    assert verify(((0, 70, 100), (80, 70, 100), (230, 70, 100)), 12) is None
+    # deux petits obstacles plus proches qu'un saut à basse vitesse
+    assert verify(((0, 40, 40), (120, 40, 40)), START_SPEED) is None
+
+
+def sim_avec_motif():
+    bucket = verify_bucket([((0, 40, 40),)], START_SPEED, 1.0)
+    assert bucket
+    index = PatternIndex.from_buckets(DEFAULT_TUNING, START_SPEED, 1.0, [bucket])
+    return RunnerSim(seed=1, patterns=index)
+
+
+def test_motif_attend_obstacle_passe():
+    sim = sim_avec_motif()
+    # obstacle isolé de secours encore devant le joueur
+    sim.obstacles.add(sim.pool.acquire(WIDTH, 40, 40))
+    sim.timer = 1
+    assert not sim.step(INPUT_NONE) & EVENT_SPAWN
+    assert len(sim.obstacles) == 1
+
+
+def test_motif_attend_retour_au_sol():
+    sim = sim_avec_motif()
+    sim.timer = 1
+    events = sim.step(INPUT_JUMP)
+    while not sim.player.on_ground:
+        assert not events & EVENT_SPAWN
+        events = sim.step(INPUT_NONE)
+    # au sol, piste vide : le motif part à l'atterrissage
+    assert events & EVENT_SPAWN
+
+
+def test_sans_bibliotheque_inchange():
+    sim = RunnerSim(seed=1)
+    sim.obstacles.add(sim.pool.acquire(WIDTH, 40, 40))
+    sim.timer = 1
+    assert sim.step(INPUT_NONE) & EVENT_SPAWN
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""Serveur Chasse au Trésor : les requêtes mal formées donnent {"ok": false} sans lever."""
+
+import json
+
+import pytest
+
+from serveur_chasse import RoueTemporelle, ServeurChasse
+
+
+@pytest.fixture
+def serveur():
+    serveur = ServeurChasse()
+    serveur.roue = RoueTemporelle()
+    return serveur
+
+
+def envoyer(serveur, requete):
+    ligne = requete if isinstance(requete, (str, bytes)) else json.dumps(requete)
+    return serveur.traiter(ligne, None)
+
+
+@pytest.mark.parametrize("requete", [
+    '"ident"',
+    "5",
+    "[1, 2]",
+    "null",
+    "{",
+    b"\xff\xfe",
+    "[" * 5000 + "]" * 5000,
+    {"op": ["nouvelle"]},
+    {"op": "nouvelle", "mode": ["Classique"]},
+    {"op": "nouvelle", "mode": "Chrono", "chrono": None},
+    {"op": "nouvelle", "mode": "Chrono", "chrono": [60]},
+    {"op": "nouvelle", "mode": "Chrono", "chrono": "abc"},
+    '{"op": "nouvelle", "mode": "Chrono", "chrono": Infinity}',
+    {"op": "nouvelle", "graine": [1]},
+    {"op": "nouvelle", "graine": {"a": 1}},
+    {"op": "etat", "session": [1]},
+    {"op": "etat", "session": {"a": 1}},
+    {"op": "jouer", "session": None, "x": 0, "y": 0},
+    {"op": "fermer"},
+])
+def test_requete_mal_formee(serveur, requete):
+    reponse = envoyer(serveur, requete)
+    assert reponse["ok"] is False
+    assert reponse["erreur"]
+    json.dumps(reponse)
+
+
+def test_id_renvoye_meme_en_erreur(serveur):
+    assert envoyer(serveur, {"op": "etat", "session": [1], "id": 7}) == {
+        "ok": False, "erreur": "session inconnue ou expirée", "id": 7}
+
+
+def test_coordonnees_invalides(serveur):
+    sid = envoyer(serveur, {"op": "nouvelle", "graine": 3})["session"]
+    for x in (None, [0], "a", 1e400, -1, 99):
+        reponse = envoyer(serveur, {"op": "jouer", "session": sid, "x": x, "y": 0})
+        assert reponse["ok"] is False
+    assert envoyer(serveur, {"op": "etat", "session": sid})["tentatives"] == 0
+
+
+def test_partie_valide(serveur):
+    nouvelle = envoyer(serveur, {"op": "nouvelle", "mode": "Chrono", "chrono": "45", "graine": "abc", "id": 1})
+    assert nouvelle["ok"] and nouvelle["chrono"] == 45 and nouvelle["id"] == 1
+    reponse = envoyer(serveur, {"op": "jouer", "session": nouvelle["session"], "x": 0, "y": 0})
+    assert reponse["ok"] and reponse["tentatives"] == 1
+    assert envoyer(serveur, {"op": "fermer", "session": nouvelle["session"]}) == {"ok": True}